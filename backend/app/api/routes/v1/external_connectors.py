@@ -25,7 +25,8 @@ async def sync_data_auto_health_export(
             detail="Token does not match user_id",
         )
 
-    content_str = json.dumps(body)
+    # Compact separators: exports can be several MB and are passed through the Celery broker
+    content_str = json.dumps(body, separators=(",", ":"))
 
     # Queue the import task in Celery with auto-health-export source
     process_apple_upload.delay(
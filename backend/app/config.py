@@ -39,6 +39,9 @@ class Settings(BaseSettings):
     db_name: str = "open-wearables"
     db_user: str = "open-wearables"
     db_password: SecretStr = SecretStr("open-wearables")
+    db_pool_size: int = 20
+    db_max_overflow: int = 30
+    db_pool_recycle: int = 3600
 
     # Sentry
     SENTRY_ENABLED: bool = False
@@ -28,10 +28,10 @@ from app.utils.mappings_meta import AutoRelMeta
 engine = create_engine(
     settings.db_uri,
     pool_pre_ping=True,
-    pool_size=20,
-    max_overflow=30,
+    pool_size=settings.db_pool_size,
+    max_overflow=settings.db_max_overflow,
     pool_timeout=30,
-    pool_recycle=3600,
+    pool_recycle=settings.db_pool_recycle,
 )
 async_engine = create_async_engine(settings.db_uri)
 
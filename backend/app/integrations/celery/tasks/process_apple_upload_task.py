@@ -54,8 +54,9 @@ def process_apple_upload(
         )
         return {"status": "error", "reason": "invalid_user_id", "batch_id": batch_id}
 
-    # Validate user exists before processing
+    # One session for validation and import to avoid checking out a second connection
     with SessionLocal() as db:
+        # Validate user exists before processing
         user_repo = UserRepository(User)
         if not user_repo.get(db, user_uuid):
             log_structured(
@@ -68,18 +69,17 @@ def process_apple_upload(
             )
             return {"status": "skipped", "reason": "user_not_found", "batch_id": batch_id}
 
-    # Log task start
-    log_structured(
-        logger,
-        "info",
-        "Apple sync batch processing started",
-        action="apple_batch_processing_start",
-        batch_id=batch_id,
-        user_id=user_id,
-        source=source,
-    )
+        # Log task start
+        log_structured(
+            logger,
+            "info",
+            "Apple sync batch processing started",
+            action="apple_batch_processing_start",
+            batch_id=batch_id,
+            user_id=user_id,
+            source=source,
+        )
 
-    with SessionLocal() as db:
         # Ensure Apple connection exists for this user (SDK-based, no OAuth tokens)
         connection_repo = UserConnectionRepository()
         connection_repo.ensure_sdk_connection(db, user_uuid, "apple")
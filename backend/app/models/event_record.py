@@ -17,7 +17,7 @@ from app.mappings import (
 class EventRecord(BaseDbModel):
     __tablename__ = "event_record"
     __table_args__ = (
-        Index("idx_event_record_source_category", "data_source_id", "category"),
+        Index("idx_event_record_source_category_time", "data_source_id", "category", "start_datetime"),
         Index("idx_event_record_source_time", "data_source_id", "start_datetime", "end_datetime"),
         UniqueConstraint(
             "data_source_id",
@@ -1,5 +1,6 @@
 import contextlib
 from datetime import datetime, time, timedelta
+from itertools import batched
 from uuid import UUID
 
 from psycopg.errors import UniqueViolation
@@ -27,6 +28,16 @@ from app.utils.pagination import decode_cursor
 # Identity tuple: (user_id, device_model, source)
 DataSourceIdentity = tuple[UUID, str | None, str | None]
 
+# Rows per INSERT statement. Each row binds 6 parameters, so 10k rows stays
+# below PostgreSQL's 65535 bind parameter limit per statement.
+BULK_INSERT_BATCH_SIZE = 10_000
+
+# From this many rows on, samples are streamed with COPY into a temporary staging
+# table and moved over with a single INSERT ... SELECT instead of multi-row INSERTs.
+COPY_THRESHOLD = 50_000
+
+_COPY_COLUMNS = ("id", "external_id", "data_source_id", "recorded_at", "value", "series_type_definition_id")
+
 
 class DataPointSeriesRepository(
     CrudRepository[DataPointSeries, TimeSeriesSampleCreate, TimeSeriesSampleUpdate],
@@ -75,7 +86,9 @@ class DataPointSeriesRepository(
 
         Optimized for performance:
         - Resolves data sources efficiently (batch fetch + batch insert missing)
-        - Inserts data points in a single batch
+        - Inserts data points with multi-row INSERT ... ON CONFLICT DO NOTHING statements
+          of up to BULK_INSERT_BATCH_SIZE rows each
+        - Loads COPY_THRESHOLD or more data points through a COPY into a staging table instead
         """
         if not creators:
             return []
@@ -94,10 +107,12 @@ class DataPointSeriesRepository(
     ) -> dict[DataSourceIdentity, UUID]:
         by_provider: dict[ProviderName, list[TimeSeriesSampleCreate]] = {}
         for c in creators:
-            provider = self.data_source_repo.infer_provider_from_source(c.source)
+            provider = None
             if c.provider:
                 with contextlib.suppress(ValueError):
                     provider = ProviderName(c.provider)
+            if provider is None:
+                provider = ProviderName.from_source_string(c.source)
             by_provider.setdefault(provider, []).append(c)
 
         identity_to_source_id: dict[DataSourceIdentity, UUID] = {}
@@ -142,14 +157,44 @@ class DataPointSeriesRepository(
                 }
             )
 
-        if values_list:
+        if len(values_list) >= COPY_THRESHOLD:
+            self._copy_data_points(db_session, values_list)
+            return
+
+        for batch in batched(values_list, BULK_INSERT_BATCH_SIZE):
             stmt = (
                 insert(self.model)
-                .values(values_list)
+                .values(list(batch))
                 .on_conflict_do_nothing(index_elements=["data_source_id", "series_type_definition_id", "recorded_at"])
             )
             db_session.execute(stmt)
-            # NOTE: Caller should commit - allows batching multiple operations
+        # NOTE: Caller should commit - allows batching multiple operations
+
+    def _copy_data_points(self, db_session: DbSession, values_list: list[dict]) -> None:
+        """Load data points with COPY through a staging table.
+
+        COPY cannot skip conflicting rows, so rows are copied into a temporary table
+        first and inserted from there with ON CONFLICT DO NOTHING. The staging table
+        lives until commit and is emptied before each use, so a copy that failed
+        earlier in the same transaction does not block the next one.
+        """
+        columns = ", ".join(_COPY_COLUMNS)
+        table = self.model.__tablename__
+        cursor = db_session.connection().connection.cursor()
+        try:
+            cursor.execute(
+                f"CREATE TEMP TABLE IF NOT EXISTS {table}_staging (LIKE {table} INCLUDING DEFAULTS) ON COMMIT DROP"
+            )
+            cursor.execute(f"TRUNCATE {table}_staging")
+            with cursor.copy(f"COPY {table}_staging ({columns}) FROM STDIN") as copy:
+                for values in values_list:
+                    copy.write_row(tuple(values[column] for column in _COPY_COLUMNS))
+            cursor.execute(
+                f"INSERT INTO {table} ({columns}) SELECT {columns} FROM {table}_staging "
+                "ON CONFLICT (data_source_id, series_type_definition_id, recorded_at) DO NOTHING"
+            )
+        finally:
+            cursor.close()
 
     def try_commit(self, db_session: DbSession, creation: DataPointSeries) -> DataPointSeries:
         try:
@@ -60,28 +60,34 @@ class EventRecordRepository(
         ):
             creation_data.pop(redundant_key, None)
 
-        creation = self.model(**creation_data)
-
+        # Single INSERT ... ON CONFLICT: duplicates are detected by the unique
+        # constraint instead of a failed insert followed by a rollback.
+        stmt = (
+            insert(self.model)
+            .values(**creation_data)
+            .on_conflict_do_nothing(constraint="uq_event_record_datetime")
+            .returning(self.model)
+        )
         try:
-            db_session.add(creation)
+            creation = db_session.execute(stmt, execution_options={"populate_existing": True}).scalar_one_or_none()
             db_session.commit()
-            db_session.refresh(creation)
-            return creation
         except IntegrityError:
             db_session.rollback()
-            existing = (
-                db_session.query(self.model)
-                .filter(
-                    self.model.data_source_id == data_source_id,
-                    self.model.start_datetime == creation.start_datetime,
-                    self.model.end_datetime == creation.end_datetime,
-                )
-                .one_or_none()
-            )
-            if existing:
-                return existing
             raise
 
+        if creation:
+            return creation
+
+        return (
+            db_session.query(self.model)
+            .filter(
+                self.model.data_source_id == data_source_id,
+                self.model.start_datetime == creation_data["start_datetime"],
+                self.model.end_datetime == creation_data["end_datetime"],
+            )
+            .one()
+        )
+
     @handle_exceptions
     def bulk_create(
         self,
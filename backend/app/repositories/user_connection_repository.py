@@ -2,6 +2,7 @@ from datetime import datetime, timedelta, timezone
 from uuid import UUID, uuid4
 
 from sqlalchemy import and_, func
+from sqlalchemy.dialects.postgresql import insert
 
 from app.database import DbSession
 from app.models import UserConnection
@@ -186,6 +187,33 @@ class UserConnectionRepository(CrudRepository[UserConnection, UserConnectionCrea
         db_session.refresh(connection)
         return connection
 
+    def upsert(self, db_session: DbSession, creator: UserConnectionCreate) -> UserConnection:
+        """Create the connection, or update tokens and user info of the existing one.
+
+        Uses a single INSERT ... ON CONFLICT statement on (user_id, provider).
+        On conflict the same rules as update_connection_info apply: the refresh token
+        and scope are only replaced when provided, provider user id and username are
+        only filled in when missing.
+        """
+        table = self.model.__table__
+        stmt = insert(self.model).values(**creator.model_dump())
+        stmt = stmt.on_conflict_do_update(
+            constraint="uq_user_provider",
+            set_={
+                "access_token": stmt.excluded.access_token,
+                "refresh_token": func.coalesce(stmt.excluded.refresh_token, table.c.refresh_token),
+                "token_expires_at": stmt.excluded.token_expires_at,
+                "provider_user_id": func.coalesce(table.c.provider_user_id, stmt.excluded.provider_user_id),
+                "provider_username": func.coalesce(table.c.provider_username, stmt.excluded.provider_username),
+                "scope": func.coalesce(stmt.excluded.scope, table.c.scope),
+                "updated_at": stmt.excluded.updated_at,
+            },
+        ).returning(self.model)
+
+        connection = db_session.execute(stmt, execution_options={"populate_existing": True}).scalar_one()
+        db_session.commit()
+        return connection
+
     def update_last_synced_at(self, db_session: DbSession, connection: UserConnection) -> UserConnection:
         """Update the last synced timestamp."""
         connection.last_synced_at = datetime.now(timezone.utc)
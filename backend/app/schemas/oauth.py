@@ -1,5 +1,6 @@
 from datetime import datetime, timezone
 from enum import Enum
+from functools import lru_cache
 from uuid import UUID, uuid4
 
 from pydantic import BaseModel, ConfigDict, Field
@@ -35,16 +36,21 @@ class ProviderName(str, Enum):
         """
         if not source:
             return cls.UNKNOWN
+        return _provider_from_source(source)
 
-        source_lower = source.lower()
-        # Check each provider (except UNKNOWN) to see if it appears in the source string
-        for provider in cls:
-            if provider == cls.UNKNOWN:
-                continue
-            if provider.value in source_lower:
-                return provider
 
-        return cls.UNKNOWN
+@lru_cache(maxsize=256)
+def _provider_from_source(source: str) -> ProviderName:
+    """Cached source string lookup; called once per sample during bulk imports."""
+    source_lower = source.lower()
+    # Check each provider (except UNKNOWN) to see if it appears in the source string
+    for provider in ProviderName:
+        if provider == ProviderName.UNKNOWN:
+            continue
+        if provider.value in source_lower:
+            return provider
+
+    return ProviderName.UNKNOWN
 
 
 class ConnectionStatus(str, Enum):
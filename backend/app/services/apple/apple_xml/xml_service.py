@@ -61,10 +61,14 @@ class XMLService:
     def _parse_date_fields(self, document: dict[str, Any]) -> dict[str, Any]:
         for field in self.DATE_FIELDS:
             if field in document:
+                # fromisoformat parses Apple's "YYYY-MM-DD HH:MM:SS +HHMM" far faster than strptime
                 try:
-                    document[field] = datetime.strptime(document[field], "%Y-%m-%d %H:%M:%S %z")
+                    parsed = datetime.fromisoformat(document[field])
                 except ValueError as e:
                     raise ValueError(f"Invalid date format for field {field}: {document[field]}") from e
+                if parsed.tzinfo is None:
+                    raise ValueError(f"Invalid date format for field {field}: {document[field]}")
+                document[field] = parsed
         return document
 
     def _create_record(
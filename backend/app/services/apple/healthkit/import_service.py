@@ -24,6 +24,7 @@ from app.schemas import (
 from app.schemas.apple.healthkit.sync_request import SyncRequest, WorkoutStatistic
 from app.services.event_record_service import event_record_service
 from app.services.timeseries_service import timeseries_service
+from app.utils.json_utils import json_loads
 from app.utils.sentry_helpers import log_and_capture_error
 from app.utils.structured_logging import log_structured
 
@@ -370,12 +371,12 @@ class ImportService:
             return None
 
         json_str = content[json_start : json_end + 1]
-        return json.loads(json_str)
+        return json_loads(json_str)
 
     def _parse_json_content(self, content: str) -> dict | None:
         """Parse JSON content directly."""
         try:
-            return json.loads(content)
+            return json_loads(content)
         except json.JSONDecodeError:
             return None
 
@@ -1,7 +1,8 @@
 """Simple API client for making authenticated requests to provider APIs."""
 
 import logging
-from datetime import datetime, timedelta, timezone
+from datetime import datetime, timezone
+from functools import lru_cache
 from typing import Any
 from uuid import UUID
 
@@ -10,12 +11,30 @@ from fastapi import HTTPException, status
 
 from app.database import DbSession
 from app.repositories.user_connection_repository import UserConnectionRepository
-from app.services.providers.templates.base_oauth import BaseOAuthTemplate
+from app.services.providers.templates.base_oauth import TOKEN_REFRESH_BUFFER, BaseOAuthTemplate
+from app.utils.json_utils import json_loads
 
 logger = logging.getLogger(__name__)
 
 
-def _get_valid_token(
+@lru_cache()
+def get_http_client() -> httpx.Client:
+    """
+    Get a singleton HTTP client shared by all provider API requests.
+
+    Reusing one client keeps connections (and TLS sessions) alive between
+    requests instead of opening a new socket for every call during a sync.
+
+    Returns:
+        httpx.Client: Pooled HTTP client instance
+    """
+    return httpx.Client(
+        limits=httpx.Limits(max_keepalive_connections=20, max_connections=100),
+        timeout=30.0,
+    )
+
+
+def get_valid_token(
     db: DbSession,
     user_id: UUID,
     provider_name: str,
@@ -24,8 +43,15 @@ def _get_valid_token(
 ) -> str:
     """Get a valid access token, refreshing if necessary.
 
-    Private function used internally by make_authenticated_request.
+    Used by make_authenticated_request, and by callers that resolve the token once
+    before fanning requests out to worker threads (which must not share the session).
+    Valid tokens are cached on the OAuth instance, so repeated requests
+    during a sync skip the connection lookup.
     """
+    cached_token = oauth.get_cached_access_token(user_id)
+    if cached_token:
+        return cached_token
+
     connection = connection_repo.get_by_user_and_provider(db, user_id, provider_name)
     if not connection:
         raise HTTPException(
@@ -41,7 +67,7 @@ def _get_valid_token(
         )
 
     # Check if token is expired (with 5 minute buffer)
-    if connection.token_expires_at and connection.token_expires_at < datetime.now(timezone.utc) + timedelta(minutes=5):
+    if connection.token_expires_at and connection.token_expires_at < datetime.now(timezone.utc) + TOKEN_REFRESH_BUFFER:
         if not connection.refresh_token:
             raise HTTPException(
                 status_code=status.HTTP_401_UNAUTHORIZED,
@@ -50,6 +76,7 @@ def _get_valid_token(
         token_response = oauth.refresh_access_token(db, user_id, connection.refresh_token)
         return token_response.access_token
 
+    oauth.cache_access_token(user_id, connection.access_token, connection.token_expires_at)
     return connection.access_token
 
 
@@ -93,8 +120,59 @@ def make_authenticated_request(
         HTTPException: If API request fails
     """
     # Get valid token (will auto-refresh if needed)
-    access_token = _get_valid_token(db, user_id, provider_name, connection_repo, oauth)
+    access_token = get_valid_token(db, user_id, provider_name, connection_repo, oauth)
+
+    return make_token_request(
+        access_token=access_token,
+        user_id=user_id,
+        oauth=oauth,
+        api_base_url=api_base_url,
+        provider_name=provider_name,
+        endpoint=endpoint,
+        method=method,
+        params=params,
+        headers=headers,
+        json_data=json_data,
+        expect_json=expect_json,
+    )
+
+
+def make_token_request(
+    access_token: str,
+    user_id: UUID,
+    oauth: BaseOAuthTemplate,
+    api_base_url: str,
+    provider_name: str,
+    endpoint: str,
+    method: str = "GET",
+    params: dict[str, Any] | None = None,
+    headers: dict[str, str] | None = None,
+    json_data: dict[str, Any] | None = None,
+    expect_json: bool = True,
+) -> Any:
+    """Make a request to provider API with an already resolved access token.
+
+    Does not touch the database, so it is safe to call from worker threads.
+
+    Args:
+        access_token: Valid access token (see get_valid_token)
+        user_id: User ID (for cache eviction and error messages)
+        oauth: OAuth instance holding the token cache
+        api_base_url: Base URL of the provider API
+        provider_name: Name of the provider (for error messages)
+        endpoint: API endpoint path (e.g., "/v3/workouts/")
+        method: HTTP method (default: GET)
+        params: Query parameters
+        headers: Additional headers (Authorization header will be added automatically)
+        json_data: JSON body for POST/PUT requests
+        expect_json: Whether to parse response as JSON (default True).
 
+    Returns:
+        Any: API response JSON, or dict with status_code if expect_json=False
+
+    Raises:
+        HTTPException: If API request fails
+    """
     # Prepare headers
     request_headers = {
         "Authorization": f"Bearer {access_token}",
@@ -107,13 +185,12 @@ def make_authenticated_request(
     url = f"{api_base_url}{endpoint}"
 
     try:
-        response = httpx.request(
+        response = get_http_client().request(
             method=method,
             url=url,
             headers=request_headers,
             params=params or {},
             json=json_data,
-            timeout=30.0,
         )
         response.raise_for_status()
 
@@ -124,7 +201,7 @@ def make_authenticated_request(
                 "accepted": response.status_code == 202,
             }
 
-        result = response.json()
+        result = json_loads(response.content)
 
         # Some APIs (like Suunto) return 200 OK but include error in response body
         if isinstance(result, dict):
@@ -148,6 +225,8 @@ def make_authenticated_request(
             f"{provider_name.capitalize()} API error for user {user_id}: {e.response.status_code} - {e.response.text}",
         )
         if e.response.status_code == 401:
+            # The provider rejected the token (revoked or disconnected), so stop serving it from the cache
+            oauth.evict_access_token(user_id)
             raise HTTPException(
                 status_code=401,
                 detail=f"{provider_name.capitalize()} authorization expired. Please re-authorize.",
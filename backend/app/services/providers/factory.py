@@ -1,3 +1,5 @@
+from functools import lru_cache
+
 from app.schemas.oauth import ProviderName
 from app.services.providers.apple.strategy import AppleStrategy
 from app.services.providers.base_strategy import BaseProviderStrategy
@@ -8,19 +10,31 @@ from app.services.providers.whoop.strategy import WhoopStrategy
 
 
 class ProviderFactory:
-    """Factory for creating provider instances."""
+    """Factory for creating provider instances.
+
+    Strategies are shared: each provider is built once per process, so its OAuth
+    component keeps cached access tokens between requests. That cache is
+    thread-safe, bounded in size and age, and evicts tokens the provider rejects
+    or a re-authorization replaces (see BaseOAuthTemplate.cache_access_token).
+    """
 
     def get_provider(self, provider_name: str) -> BaseProviderStrategy:
-        match provider_name:
-            case ProviderName.APPLE.value:
-                return AppleStrategy()
-            case ProviderName.GARMIN.value:
-                return GarminStrategy()
-            case ProviderName.SUUNTO.value:
-                return SuuntoStrategy()
-            case ProviderName.POLAR.value:
-                return PolarStrategy()
-            case ProviderName.WHOOP.value:
-                return WhoopStrategy()
-            case _:
-                raise ValueError(f"Unknown provider: {provider_name}")
+        return get_provider_strategy(provider_name)
+
+
+@lru_cache()
+def get_provider_strategy(provider_name: str) -> BaseProviderStrategy:
+    """Get the singleton strategy instance for a provider."""
+    match provider_name:
+        case ProviderName.APPLE.value:
+            return AppleStrategy()
+        case ProviderName.GARMIN.value:
+            return GarminStrategy()
+        case ProviderName.SUUNTO.value:
+            return SuuntoStrategy()
+        case ProviderName.POLAR.value:
+            return PolarStrategy()
+        case ProviderName.WHOOP.value:
+            return WhoopStrategy()
+        case _:
+            raise ValueError(f"Unknown provider: {provider_name}")
@@ -29,8 +29,9 @@ class Garmin247Data(Base247DataTemplate):
     - Parameters: uploadStartTimeInSeconds, uploadEndTimeInSeconds
     """
 
-    CHUNK_HOURS = 24  # Garmin API max range per request
+    CHUNK_SIZE = timedelta(hours=24)  # Garmin API max range per request
     DEFAULT_BACKFILL_DAYS = 7  # Default retention period
+    MAX_CONCURRENT_CHUNKS = 8  # Parallel chunk requests, kept low to respect API rate limits
 
     def __init__(
         self,
@@ -77,53 +78,12 @@ class Garmin247Data(Base247DataTemplate):
             params=params,
         )
 
-    def _fetch_in_chunks(
-        self,
-        db: DbSession,
-        user_id: UUID,
-        endpoint: str,
-        start_time: datetime,
-        end_time: datetime,
-        chunk_hours: int = 24,
-    ) -> list[dict[str, Any]]:
-        """Fetch data in 24-hour chunks to comply with Garmin API limits.
-
-        Args:
-            db: Database session
-            user_id: User ID
-            endpoint: API endpoint path
-            start_time: Start of date range
-            end_time: End of date range
-            chunk_hours: Size of each chunk in hours (default 24)
-
-        Returns:
-            List of all fetched records combined from all chunks
-        """
-        all_data: list[dict[str, Any]] = []
-        current_start = start_time
-
-        while current_start < end_time:
-            current_end = min(current_start + timedelta(hours=chunk_hours), end_time)
-
-            params = {
-                "uploadStartTimeInSeconds": self._epoch_seconds(current_start),
-                "uploadEndTimeInSeconds": self._epoch_seconds(current_end),
-            }
-
-            try:
-                response = self._make_api_request(db, user_id, endpoint, params=params)
-                if isinstance(response, list):
-                    all_data.extend(response)
-                elif response:
-                    all_data.append(response)
-            except Exception as e:
-                self.logger.warning(
-                    f"Error fetching {endpoint} chunk ({current_start.isoformat()} to {current_end.isoformat()}): {e}"
-                )
-
-            current_start = current_end
-
-        return all_data
+    def _chunk_params(self, chunk_start: datetime, chunk_end: datetime) -> dict[str, Any]:
+        """Select a chunk by upload time in UTC Unix seconds."""
+        return {
+            "uploadStartTimeInSeconds": self._epoch_seconds(chunk_start),
+            "uploadEndTimeInSeconds": self._epoch_seconds(chunk_end),
+        }
 
     # -------------------------------------------------------------------------
     # Sleep Data - /wellness-api/rest/sleeps
@@ -301,7 +261,6 @@ class Garmin247Data(Base247DataTemplate):
         normalized_daily: dict[str, Any],
     ) -> int:
         """Save daily data to DataPointSeries (multiple series types)."""
-        count = 0
         calendar_date = normalized_daily.get("calendar_date")
         start_ts = normalized_daily.get("start_time_seconds")
 
@@ -313,7 +272,7 @@ class Garmin247Data(Base247DataTemplate):
             recorded_at = self._from_epoch_seconds(start_ts)
         elif calendar_date:
             try:
-                recorded_at = datetime.strptime(calendar_date, "%Y-%m-%d").replace(hour=12, tzinfo=timezone.utc)
+                recorded_at = datetime.fromisoformat(calendar_date).replace(hour=12, tzinfo=timezone.utc)
             except ValueError:
                 return 0
         else:
@@ -328,74 +287,74 @@ class Garmin247Data(Base247DataTemplate):
             ("distance_meters", SeriesType.distance_walking_running),
         ]
 
+        samples: list[TimeSeriesSampleCreate] = []
         for field, series_type in series_mappings:
             value = normalized_daily.get(field)
             if value is not None:
                 try:
-                    sample = TimeSeriesSampleCreate(
-                        id=uuid4(),
-                        user_id=user_id,
-                        source=self.provider_name,
-                        recorded_at=recorded_at,
-                        value=Decimal(str(value)),
-                        series_type=series_type,
-                        external_id=normalized_daily.get("garmin_summary_id"),
+                    samples.append(
+                        TimeSeriesSampleCreate(
+                            id=uuid4(),
+                            user_id=user_id,
+                            source=self.provider_name,
+                            recorded_at=recorded_at,
+                            value=Decimal(str(value)),
+                            series_type=series_type,
+                            external_id=normalized_daily.get("garmin_summary_id"),
+                        )
                     )
-                    self.data_point_repo.create(db, sample)
-                    count += 1
                 except Exception as e:
                     self.logger.debug(f"Failed to save {field}: {e}")
 
-        # Save heart rate samples if present
+        # Add heart rate samples if present
         hr_samples = normalized_daily.get("heart_rate_samples")
         if hr_samples and isinstance(hr_samples, dict):
-            count += self._save_heart_rate_samples(db, user_id, start_ts or 0, hr_samples)
+            samples.extend(self._build_heart_rate_samples(user_id, start_ts or 0, hr_samples))
 
-        return count
+        # Daily metrics and heart rate samples go in together with a single commit
+        return self._bulk_save_samples(db, samples)
 
-    def _save_heart_rate_samples(
+    def _build_heart_rate_samples(
         self,
-        db: DbSession,
         user_id: UUID,
         base_timestamp: int,
         hr_samples: dict[str, int],
-    ) -> int:
-        """Save individual heart rate samples from daily summary.
+    ) -> list[TimeSeriesSampleCreate]:
+        """Build individual heart rate samples from daily summary.
 
         Args:
-            db: Database session
             user_id: User ID
             base_timestamp: Base Unix timestamp (start of day)
             hr_samples: Dict of offset_seconds -> heart_rate_bpm
 
         Returns:
-            Number of samples saved
+            Samples ready to be saved
         """
-        count = 0
         base_dt = self._from_epoch_seconds(base_timestamp) if base_timestamp else None
 
         if not base_dt:
-            return 0
+            return []
 
+        samples: list[TimeSeriesSampleCreate] = []
         for offset_str, hr_value in hr_samples.items():
             try:
                 offset_seconds = int(offset_str)
                 recorded_at = base_dt + timedelta(seconds=offset_seconds)
 
-                sample = TimeSeriesSampleCreate(
-                    id=uuid4(),
-                    user_id=user_id,
-                    source=self.provider_name,
-                    recorded_at=recorded_at,
-                    value=Decimal(str(hr_value)),
-                    series_type=SeriesType.heart_rate,
+                samples.append(
+                    TimeSeriesSampleCreate(
+                        id=uuid4(),
+                        user_id=user_id,
+                        source=self.provider_name,
+                        recorded_at=recorded_at,
+                        value=Decimal(str(hr_value)),
+                        series_type=SeriesType.heart_rate,
+                    )
                 )
-                self.data_point_repo.create(db, sample)
-                count += 1
             except Exception:
                 pass
 
-        return count
+        return samples
 
     # -------------------------------------------------------------------------
     # Epochs Data - /wellness-api/rest/epochs (15-minute granularity)
@@ -479,7 +438,7 @@ class Garmin247Data(Base247DataTemplate):
         normalized_epochs: dict[str, list[dict[str, Any]]],
     ) -> int:
         """Save epoch samples to DataPointSeries."""
-        count = 0
+        samples_to_save: list[TimeSeriesSampleCreate] = []
         type_mapping: dict[str, SeriesType] = {
             "heart_rate": SeriesType.heart_rate,
             "steps": SeriesType.steps,
@@ -500,20 +459,20 @@ class Garmin247Data(Base247DataTemplate):
 
                 try:
                     recorded_at = datetime.fromisoformat(timestamp_str.replace("Z", "+00:00"))
-                    sample_create = TimeSeriesSampleCreate(
-                        id=uuid4(),
-                        user_id=user_id,
-                        source=self.provider_name,
-                        recorded_at=recorded_at,
-                        value=Decimal(str(value)),
-                        series_type=series_type,
+                    samples_to_save.append(
+                        TimeSeriesSampleCreate(
+                            id=uuid4(),
+                            user_id=user_id,
+                            source=self.provider_name,
+                            recorded_at=recorded_at,
+                            value=Decimal(str(value)),
+                            series_type=series_type,
+                        )
                     )
-                    self.data_point_repo.create(db, sample_create)
-                    count += 1
                 except Exception:
                     pass
 
-        return count
+        return self._bulk_save_samples(db, samples_to_save)
 
     # -------------------------------------------------------------------------
     # Body Composition - /wellness-api/rest/bodyComps
@@ -536,7 +495,6 @@ class Garmin247Data(Base247DataTemplate):
         raw_body_comp: dict[str, Any],
     ) -> int:
         """Save body composition metrics to DataPointSeries."""
-        count = 0
         measurement_ts = raw_body_comp.get("measurementTimeInSeconds", 0)
 
         if not measurement_ts:
@@ -544,22 +502,23 @@ class Garmin247Data(Base247DataTemplate):
 
         recorded_at = self._from_epoch_seconds(measurement_ts)
         summary_id = raw_body_comp.get("summaryId")
+        samples: list[TimeSeriesSampleCreate] = []
 
         # Weight (convert grams to kg)
         weight_grams = raw_body_comp.get("weightInGrams")
         if weight_grams:
             try:
-                sample = TimeSeriesSampleCreate(
-                    id=uuid4(),
-                    user_id=user_id,
-                    source=self.provider_name,
-                    recorded_at=recorded_at,
-                    value=Decimal(str(weight_grams)) / 1000,  # Convert to kg
-                    series_type=SeriesType.weight,
-                    external_id=summary_id,
+                samples.append(
+                    TimeSeriesSampleCreate(
+                        id=uuid4(),
+                        user_id=user_id,
+                        source=self.provider_name,
+                        recorded_at=recorded_at,
+                        value=Decimal(str(weight_grams)) / 1000,  # Convert to kg
+                        series_type=SeriesType.weight,
+                        external_id=summary_id,
+                    )
                 )
-                self.data_point_repo.create(db, sample)
-                count += 1
             except Exception as e:
                 self.logger.debug(f"Failed to save weight: {e}")
 
@@ -567,17 +526,17 @@ class Garmin247Data(Base247DataTemplate):
         body_fat = raw_body_comp.get("bodyFatInPercent")
         if body_fat:
             try:
-                sample = TimeSeriesSampleCreate(
-                    id=uuid4(),
-                    user_id=user_id,
-                    source=self.provider_name,
-                    recorded_at=recorded_at,
-                    value=Decimal(str(body_fat)),
-                    series_type=SeriesType.body_fat_percentage,
-                    external_id=summary_id,
+                samples.append(
+                    TimeSeriesSampleCreate(
+                        id=uuid4(),
+                        user_id=user_id,
+                        source=self.provider_name,
+                        recorded_at=recorded_at,
+                        value=Decimal(str(body_fat)),
+                        series_type=SeriesType.body_fat_percentage,
+                        external_id=summary_id,
+                    )
                 )
-                self.data_point_repo.create(db, sample)
-                count += 1
             except Exception as e:
                 self.logger.debug(f"Failed to save body fat: {e}")
 
@@ -585,21 +544,21 @@ class Garmin247Data(Base247DataTemplate):
         bmi = raw_body_comp.get("bodyMassIndex")
         if bmi:
             try:
-                sample = TimeSeriesSampleCreate(
-                    id=uuid4(),
-                    user_id=user_id,
-                    source=self.provider_name,
-                    recorded_at=recorded_at,
-                    value=Decimal(str(bmi)),
-                    series_type=SeriesType.body_mass_index,
-                    external_id=summary_id,
+                samples.append(
+                    TimeSeriesSampleCreate(
+                        id=uuid4(),
+                        user_id=user_id,
+                        source=self.provider_name,
+                        recorded_at=recorded_at,
+                        value=Decimal(str(bmi)),
+                        series_type=SeriesType.body_mass_index,
+                        external_id=summary_id,
+                    )
                 )
-                self.data_point_repo.create(db, sample)
-                count += 1
             except Exception as e:
                 self.logger.debug(f"Failed to save BMI: {e}")
 
-        return count
+        return self._bulk_save_samples(db, samples)
 
     # -------------------------------------------------------------------------
     # HRV (Heart Rate Variability) - /wellness-api/rest/hrv
@@ -628,7 +587,6 @@ class Garmin247Data(Base247DataTemplate):
         Returns:
             Number of records saved
         """
-        count = 0
         start_ts = raw_hrv.get("startTimeInSeconds", 0)
         summary_id = raw_hrv.get("summaryId")
         calendar_date = raw_hrv.get("calendarDate")
@@ -637,24 +595,26 @@ class Garmin247Data(Base247DataTemplate):
             self.logger.warning("HRV data missing startTimeInSeconds")
             return 0
 
+        samples: list[TimeSeriesSampleCreate] = []
+
         # Save lastNightAvg as the main HRV value for the night
         last_night_avg = raw_hrv.get("lastNightAvg")
         if last_night_avg is not None:
             try:
                 # Use the start time as recorded_at for the nightly average
                 recorded_at = self._from_epoch_seconds(start_ts)
-                sample = TimeSeriesSampleCreate(
-                    id=uuid4(),
-                    user_id=user_id,
-                    source=self.provider_name,
-                    recorded_at=recorded_at,
-                    value=Decimal(str(last_night_avg)),
-                    series_type=SeriesType.heart_rate_variability_sdnn,
-                    external_id=summary_id,
+                samples.append(
+                    TimeSeriesSampleCreate(
+                        id=uuid4(),
+                        user_id=user_id,
+                        source=self.provider_name,
+                        recorded_at=recorded_at,
+                        value=Decimal(str(last_night_avg)),
+                        series_type=SeriesType.heart_rate_variability_sdnn,
+                        external_id=summary_id,
+                    )
                 )
-                self.data_point_repo.create(db, sample)
-                count += 1
-                self.logger.debug(f"Saved HRV nightly avg={last_night_avg}ms for {calendar_date}")
+                self.logger.debug(f"Prepared HRV nightly avg={last_night_avg}ms for {calendar_date}")
             except Exception as e:
                 self.logger.debug(f"Failed to save HRV lastNightAvg: {e}")
 
@@ -666,21 +626,22 @@ class Garmin247Data(Base247DataTemplate):
                 try:
                     offset_seconds = int(offset_str)
                     recorded_at = self._from_epoch_seconds(start_ts + offset_seconds)
-                    sample = TimeSeriesSampleCreate(
-                        id=uuid4(),
-                        user_id=user_id,
-                        source=self.provider_name,
-                        recorded_at=recorded_at,
-                        value=Decimal(str(hrv_ms)),
-                        series_type=SeriesType.heart_rate_variability_sdnn,
-                        external_id=f"{summary_id}:{offset_str}" if summary_id else None,
+                    samples.append(
+                        TimeSeriesSampleCreate(
+                            id=uuid4(),
+                            user_id=user_id,
+                            source=self.provider_name,
+                            recorded_at=recorded_at,
+                            value=Decimal(str(hrv_ms)),
+                            series_type=SeriesType.heart_rate_variability_sdnn,
+                            external_id=f"{summary_id}:{offset_str}" if summary_id else None,
+                        )
                     )
-                    self.data_point_repo.create(db, sample)
-                    count += 1
                 except Exception as e:
                     self.logger.debug(f"Failed to save HRV value at offset {offset_str}: {e}")
 
-        return count
+        # Nightly average and individual readings go in together with a single commit
+        return self._bulk_save_samples(db, samples)
 
     # -------------------------------------------------------------------------
     # Abstract Method Implementations (from Base247DataTemplate)
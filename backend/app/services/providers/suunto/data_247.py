@@ -1,5 +1,6 @@
 """Suunto 247 Data implementation for sleep, recovery, and activity samples."""
 
+from contextlib import suppress
 from datetime import datetime, timedelta
 from decimal import Decimal
 from typing import Any
@@ -14,7 +15,7 @@ from app.schemas import EventRecordCreate, TimeSeriesSampleCreate
 from app.schemas.event_record_detail import EventRecordDetailCreate
 from app.schemas.series_types import SeriesType
 from app.services.event_record_service import event_record_service
-from app.services.providers.api_client import make_authenticated_request
+from app.services.providers.api_client import make_authenticated_request, make_token_request
 from app.services.providers.templates.base_247_data import Base247DataTemplate
 from app.services.providers.templates.base_oauth import BaseOAuthTemplate
 
@@ -22,6 +23,22 @@ from app.services.providers.templates.base_oauth import BaseOAuthTemplate
 class Suunto247Data(Base247DataTemplate):
     """Suunto implementation for 247 data (sleep, recovery, activity)."""
 
+    # Suunto API rejects ranges over 28 days; keep a day of margin for boundary/timezone rounding
+    MAX_RANGE_DAYS = 27
+    CHUNK_SIZE = timedelta(days=MAX_RANGE_DAYS)
+    MAX_CONCURRENT_CHUNKS = 4  # Parallel chunk requests for long backfills
+
+    # Normalized activity sample key -> (SeriesType, value field in the normalized sample)
+    ACTIVITY_SAMPLE_MAPPING: dict[str, tuple[SeriesType, str]] = {
+        "heart_rate": (SeriesType.heart_rate, "bpm"),
+        "steps": (SeriesType.steps, "count"),
+        "spo2": (SeriesType.oxygen_saturation, "percent"),
+        "energy": (SeriesType.energy, "kcal"),
+        # TODO: Suunto provides RMSSD, not SDNN. See GitHub issue for fix.
+        # https://www.suunto.com/sports/News-Articles-container-page/how-to-use-hrv-to-optimize-your-recovery/
+        "hrv": (SeriesType.heart_rate_variability_sdnn, "rmssd_ms"),
+    }
+
     def __init__(
         self,
         provider_name: str,
@@ -73,39 +90,36 @@ class Suunto247Data(Base247DataTemplate):
         """Convert datetime to epoch milliseconds."""
         return int(dt.timestamp() * 1000)
 
-    def _fetch_in_chunks(
+    def _make_token_request(
         self,
-        db: DbSession,
+        access_token: str,
         user_id: UUID,
         endpoint: str,
-        start_time: datetime,
-        end_time: datetime,
-        chunk_days: int = 20,
-    ) -> list[dict[str, Any]]:
-        """Fetch data in chunks to avoid 28-day limit."""
-        all_data = []
-        current_start = start_time
-
-        while current_start < end_time:
-            current_end = min(current_start + timedelta(days=chunk_days), end_time)
-
-            params = {
-                "from": self._epoch_ms(current_start),
-                "to": self._epoch_ms(current_end),
-            }
-
-            try:
-                response = self._make_api_request(db, user_id, endpoint, params=params)
-                if isinstance(response, list):
-                    all_data.extend(response)
-            except Exception as e:
-                # Log error but continue with other chunks if possible
-                # In a real scenario, we might want to re-raise or handle differently
-                print(f"Error fetching chunk {current_start} to {current_end}: {e}")
+        params: dict[str, Any] | None = None,
+    ) -> Any:
+        """Make request to Suunto API with an already resolved token (no database access)."""
+        return make_token_request(
+            access_token=access_token,
+            user_id=user_id,
+            oauth=self.oauth,
+            api_base_url=self.api_base_url,
+            provider_name=self.provider_name,
+            endpoint=endpoint,
+            method="GET",
+            params=params,
+            headers=self._get_suunto_headers(),
+        )
 
-            current_start = current_end
+    def _chunk_params(self, chunk_start: datetime, chunk_end: datetime) -> dict[str, Any]:
+        """Select a chunk by time range in epoch milliseconds."""
+        return {
+            "from": self._epoch_ms(chunk_start),
+            "to": self._epoch_ms(chunk_end),
+        }
 
-        return all_data
+    def _chunk_records(self, response: Any) -> list[dict[str, Any]]:
+        """Suunto sample endpoints return a list; anything else carries no records."""
+        return response if isinstance(response, list) else []
 
     # -------------------------------------------------------------------------
     # Sleep Data - Suunto /247samples/sleep
@@ -127,7 +141,7 @@ class Suunto247Data(Base247DataTemplate):
         user_id: UUID,
     ) -> dict[str, Any]:
         """Normalize Suunto sleep data to our schema."""
-        entry_data = raw_sleep.get("entryData", {})
+        entry_data = raw_sleep.get("entryData") or {}
         timestamp = raw_sleep.get("timestamp")
 
         # Parse bedtime times
@@ -300,8 +314,10 @@ class Suunto247Data(Base247DataTemplate):
         hrv_samples = []
 
         for sample in raw_samples:
+            entry_data = sample.get("entryData")
+            if not entry_data:
+                continue
             timestamp = sample.get("timestamp")
-            entry_data = sample.get("entryData", {})
 
             # Heart Rate
             hr = entry_data.get("HR")
@@ -314,11 +330,7 @@ class Suunto247Data(Base247DataTemplate):
                     },
                 )
 
-            # HR extended (min/max)
-            hr_ext = entry_data.get("HRExt", {})
-            if hr_ext:
-                # Could store min/max separately if needed
-                pass
+            # HR extended (min/max) under "HRExt" is not stored yet
 
             # Steps
             steps = entry_data.get("StepCount")
@@ -343,11 +355,12 @@ class Suunto247Data(Base247DataTemplate):
             # Energy consumption (joules)
             energy = entry_data.get("EnergyConsumption")
             if energy is not None:
+                joules = float(energy)
                 energy_samples.append(
                     {
                         "timestamp": timestamp,
-                        "joules": float(energy),
-                        "kcal": float(energy) / 4184,  # Convert to kcal
+                        "joules": joules,
+                        "kcal": joules / 4184,  # Convert to kcal
                     },
                 )
 
@@ -383,10 +396,9 @@ class Suunto247Data(Base247DataTemplate):
         """Fetch aggregated daily activity statistics from Suunto API."""
         all_data = []
         current_start = start_date
-        chunk_days = 14  # Reduced to 14 days to be safe (limit is 28 days)
 
         while current_start < end_date:
-            current_end = min(current_start + timedelta(days=chunk_days), end_date)
+            current_end = min(current_start + timedelta(days=self.MAX_RANGE_DAYS), end_date)
 
             # Suunto uses ISO 8601 format for this endpoint
             params = {
@@ -400,7 +412,7 @@ class Suunto247Data(Base247DataTemplate):
                 if isinstance(response, list):
                     all_data.extend(response)
             except Exception as e:
-                print(f"Error fetching daily activity chunk {current_start} to {current_end}: {e}")
+                self.logger.warning(f"Error fetching daily activity chunk {current_start} to {current_end}: {e}")
 
             current_start = current_end
 
@@ -450,67 +462,53 @@ class Suunto247Data(Base247DataTemplate):
         normalized_samples: dict[str, list[dict[str, Any]]],
     ) -> int:
         """Save normalized activity samples to database."""
-        count = 0
+        samples_to_save: list[TimeSeriesSampleCreate] = []
 
-        # Map internal keys to SeriesType
-        type_mapping = {
-            "heart_rate": SeriesType.heart_rate,
-            "steps": SeriesType.steps,
-            "spo2": SeriesType.oxygen_saturation,
-            "energy": SeriesType.energy,
-            # TODO: Suunto provides RMSSD, not SDNN. See GitHub issue for fix.
-            # https://www.suunto.com/sports/News-Articles-container-page/how-to-use-hrv-to-optimize-your-recovery/
-            "hrv": SeriesType.heart_rate_variability_sdnn,
-        }
+        # Every series shares the same raw timestamps, so parse each one only once
+        recorded_at_by_timestamp: dict[str, datetime | None] = {}
 
         for key, samples in normalized_samples.items():
-            series_type = type_mapping.get(key)
-            if not series_type:
+            mapping = self.ACTIVITY_SAMPLE_MAPPING.get(key)
+            if not mapping:
                 continue
+            series_type, value_key = mapping
 
             for sample in samples:
                 timestamp_str = sample.get("timestamp")
                 if not timestamp_str:
                     continue
 
-                try:
-                    recorded_at = datetime.fromisoformat(timestamp_str.replace("Z", "+00:00"))
-                except ValueError:
-                    continue
+                if timestamp_str in recorded_at_by_timestamp:
+                    recorded_at = recorded_at_by_timestamp[timestamp_str]
+                else:
+                    try:
+                        recorded_at = datetime.fromisoformat(timestamp_str.replace("Z", "+00:00"))
+                    except ValueError:
+                        recorded_at = None
+                    recorded_at_by_timestamp[timestamp_str] = recorded_at
 
-                # Extract value based on key
-                value = None
-                if key == "heart_rate":
-                    value = sample.get("bpm")
-                elif key == "steps":
-                    value = sample.get("count")
-                elif key == "spo2":
-                    value = sample.get("percent")
-                elif key == "energy":
-                    value = sample.get("kcal")
-                elif key == "hrv":
-                    value = sample.get("rmssd_ms")
+                if recorded_at is None:
+                    continue
 
+                value = sample.get(value_key)
                 if value is None:
                     continue
 
-                try:
-                    sample_create = TimeSeriesSampleCreate(
-                        id=uuid4(),
-                        user_id=user_id,
-                        source=self.provider_name,
-                        recorded_at=recorded_at,
-                        value=Decimal(str(value)),
-                        series_type=series_type,
-                        external_id=None,  # Suunto doesn't provide ID for individual samples
+                # Skip samples that fail validation but continue with the rest
+                with suppress(Exception):
+                    samples_to_save.append(
+                        TimeSeriesSampleCreate(
+                            id=uuid4(),
+                            user_id=user_id,
+                            source=self.provider_name,
+                            recorded_at=recorded_at,
+                            value=Decimal(str(value)),
+                            series_type=series_type,
+                            external_id=None,  # Suunto doesn't provide ID for individual samples
+                        )
                     )
-                    self.data_point_repo.create(db, sample_create)
-                    count += 1
-                except Exception:
-                    # Log error but continue
-                    pass
 
-        return count
+        return self._bulk_save_samples(db, samples_to_save)
 
     def save_daily_activity_statistics(
         self,
@@ -519,7 +517,7 @@ class Suunto247Data(Base247DataTemplate):
         normalized_stats: list[dict[str, Any]],
     ) -> int:
         """Save normalized daily activity statistics to database."""
-        count = 0
+        samples_to_save: list[TimeSeriesSampleCreate] = []
 
         for stat in normalized_stats:
             stat_type = stat.get("type")
@@ -549,21 +547,21 @@ class Suunto247Data(Base247DataTemplate):
                     if series_type == SeriesType.energy:
                         final_value = final_value / Decimal("4184")
 
-                    sample_create = TimeSeriesSampleCreate(
-                        id=uuid4(),
-                        user_id=user_id,
-                        source=self.provider_name,
-                        recorded_at=recorded_at,
-                        value=final_value,
-                        series_type=series_type,
-                        external_id=None,
+                    samples_to_save.append(
+                        TimeSeriesSampleCreate(
+                            id=uuid4(),
+                            user_id=user_id,
+                            source=self.provider_name,
+                            recorded_at=recorded_at,
+                            value=final_value,
+                            series_type=series_type,
+                            external_id=None,
+                        )
                     )
-                    self.data_point_repo.create(db, sample_create)
-                    count += 1
                 except Exception:
                     pass
 
-        return count
+        return self._bulk_save_samples(db, samples_to_save)
 
     # -------------------------------------------------------------------------
     # Load and Save All Data
@@ -576,10 +574,20 @@ class Suunto247Data(Base247DataTemplate):
         start_time: datetime,
         end_time: datetime,
     ) -> int:
-        """Load sleep data from API and save to database."""
+        """Load sleep data from API and save to database.
+
+        Chunk boundaries are inclusive, so a sleep ending on a boundary can be
+        returned twice; each sleep is normalized and saved only once.
+        """
         raw_data = self.get_sleep_data(db, user_id, start_time, end_time)
         count = 0
+        seen: set[Any] = set()
         for item in raw_data:
+            sleep_key = (item.get("entryData") or {}).get("SleepId") or item.get("timestamp")
+            if sleep_key is not None:
+                if sleep_key in seen:
+                    continue
+                seen.add(sleep_key)
             normalized = self.normalize_sleep(item, user_id)
             try:
                 self.save_sleep_data(db, user_id, normalized)
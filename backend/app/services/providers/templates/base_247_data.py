@@ -2,11 +2,16 @@
 
 import logging
 from abc import ABC, abstractmethod
-from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
 from typing import Any
 from uuid import UUID
 
 from app.database import DbSession
+from app.repositories import UserConnectionRepository
+from app.repositories.data_point_series_repository import DataPointSeriesRepository
+from app.schemas import TimeSeriesSampleCreate
+from app.services.providers.api_client import get_valid_token, make_token_request
 from app.services.providers.templates.base_oauth import BaseOAuthTemplate
 
 
@@ -19,6 +24,13 @@ class Base247DataTemplate(ABC):
     - Includes: sleep sessions, recovery metrics, activity samples (steps, HR, etc.)
     """
 
+    CHUNK_SIZE = timedelta(days=1)  # Provider API max range per request
+    MAX_CONCURRENT_CHUNKS = 4  # Parallel chunk requests, kept low to respect API rate limits
+
+    # Set by providers that use the chunked fetching and bulk saving helpers below
+    connection_repo: UserConnectionRepository
+    data_point_repo: DataPointSeriesRepository
+
     def __init__(
         self,
         provider_name: str,
@@ -30,6 +42,117 @@ class Base247DataTemplate(ABC):
         self.oauth = oauth
         self.logger = logging.getLogger(self.__class__.__name__)
 
+    # -------------------------------------------------------------------------
+    # Chunked Fetching
+    # -------------------------------------------------------------------------
+
+    def _get_access_token(self, db: DbSession, user_id: UUID) -> str:
+        """Resolve a valid access token through the database session (refreshing if needed)."""
+        return get_valid_token(db, user_id, self.provider_name, self.connection_repo, self.oauth)
+
+    def _make_token_request(
+        self,
+        access_token: str,
+        user_id: UUID,
+        endpoint: str,
+        params: dict[str, Any] | None = None,
+    ) -> Any:
+        """Make request to provider API with an already resolved token (no database access)."""
+        return make_token_request(
+            access_token=access_token,
+            user_id=user_id,
+            oauth=self.oauth,
+            api_base_url=self.api_base_url,
+            provider_name=self.provider_name,
+            endpoint=endpoint,
+            method="GET",
+            params=params,
+        )
+
+    def _chunk_params(self, chunk_start: datetime, chunk_end: datetime) -> dict[str, Any]:
+        """Build the query parameters selecting one chunk's time range."""
+        raise NotImplementedError(f"{self.__class__.__name__} does not support chunked fetching")
+
+    def _chunk_records(self, response: Any) -> list[dict[str, Any]]:
+        """Extract the records from one chunk's API response."""
+        if isinstance(response, list):
+            return response
+        return [response] if response else []
+
+    def _fetch_in_chunks(
+        self,
+        db: DbSession,
+        user_id: UUID,
+        endpoint: str,
+        start_time: datetime,
+        end_time: datetime,
+        chunk_size: timedelta | None = None,
+    ) -> list[dict[str, Any]]:
+        """Fetch data in chunks to comply with the provider's max range per request.
+
+        The access token is resolved once on the calling thread, the only place the
+        database session is used. Chunks are then fetched concurrently with that
+        token; worker threads never receive the (non thread-safe) session.
+
+        Args:
+            db: Database session
+            user_id: User ID
+            endpoint: API endpoint path
+            start_time: Start of date range
+            end_time: End of date range
+            chunk_size: Size of each chunk (default CHUNK_SIZE)
+
+        Returns:
+            List of all fetched records combined from all chunks, in chronological order
+        """
+        chunk_size = chunk_size or self.CHUNK_SIZE
+        windows: list[tuple[datetime, datetime]] = []
+        current_start = start_time
+        while current_start < end_time:
+            current_end = min(current_start + chunk_size, end_time)
+            windows.append((current_start, current_end))
+            current_start = current_end
+
+        if not windows:
+            return []
+
+        try:
+            access_token = self._get_access_token(db, user_id)
+        except Exception as e:
+            self.logger.warning(f"Error resolving access token for {endpoint}: {e}")
+            return []
+
+        def fetch_chunk(window: tuple[datetime, datetime]) -> list[dict[str, Any]]:
+            chunk_start, chunk_end = window
+            params = self._chunk_params(chunk_start, chunk_end)
+            try:
+                response = self._make_token_request(access_token, user_id, endpoint, params=params)
+                return self._chunk_records(response)
+            except Exception as e:
+                self.logger.warning(
+                    f"Error fetching {endpoint} chunk ({chunk_start.isoformat()} to {chunk_end.isoformat()}): {e}"
+                )
+                return []
+
+        if len(windows) == 1:
+            chunks = [fetch_chunk(windows[0])]
+        else:
+            with ThreadPoolExecutor(max_workers=min(self.MAX_CONCURRENT_CHUNKS, len(windows))) as executor:
+                chunks = list(executor.map(fetch_chunk, windows))
+
+        return [record for chunk in chunks for record in chunk]
+
+    def _bulk_save_samples(self, db: DbSession, samples: list[TimeSeriesSampleCreate]) -> int:
+        """Insert samples in batches and commit once.
+
+        Returns the number of samples submitted (duplicates are skipped by the database).
+        """
+        if not samples:
+            return 0
+        self.data_point_repo.bulk_create(db, samples)
+        db.commit()
+        return len(samples)
+
     # -------------------------------------------------------------------------
     # Sleep Data
     # -------------------------------------------------------------------------
@@ -1,10 +1,16 @@
 import hashlib
 import json
 import secrets
+import threading
+import time
 from abc import ABC, abstractmethod
 from base64 import b64encode, urlsafe_b64encode
+from collections import OrderedDict
 from datetime import datetime, timedelta, timezone
-from typing import Any
+from functools import cached_property
+from types import MappingProxyType
+from typing import Any, Mapping
+from urllib.parse import quote
 from uuid import UUID
 
 import httpx
@@ -24,6 +30,13 @@ from app.schemas.oauth import (
     UserConnectionCreate,
 )
 
+# Tokens expiring within this window are treated as expired and refreshed
+TOKEN_REFRESH_BUFFER = timedelta(minutes=5)
+# Cached tokens are re-read from the connection at least this often, so revocations made elsewhere are picked up
+TOKEN_CACHE_MAX_AGE = timedelta(minutes=10)
+# Least recently used tokens are dropped beyond this many cached users
+TOKEN_CACHE_MAX_SIZE = 1024
+
 
 class BaseOAuthTemplate(ABC):
     """Base template for OAuth 2.0 authentication flow."""
@@ -41,6 +54,10 @@ class BaseOAuthTemplate(ABC):
         self.api_base_url = api_base_url
         self.redis_client = get_redis_client()
         self.state_ttl = 900  # 15 minutes
+        # user_id -> (access_token, monotonic refresh deadline); avoids a connection lookup per API request
+        self._token_cache: OrderedDict[UUID, tuple[str, float]] = OrderedDict()
+        # Strategies are shared process-wide, so the cache is used from many request and worker threads
+        self._token_cache_lock = threading.Lock()
 
     @property
     @abstractmethod
@@ -109,6 +126,11 @@ class BaseOAuthTemplate(ABC):
             )
             response.raise_for_status()
             token_response = OAuthTokenResponse.model_validate(response.json())
+            self.cache_access_token(
+                user_id,
+                token_response.access_token,
+                datetime.now(timezone.utc) + timedelta(seconds=token_response.expires_in),
+            )
 
             connection = self.connection_repo.get_by_user_and_provider(db, user_id, self.provider_name)
             if connection:
@@ -123,10 +145,63 @@ class BaseOAuthTemplate(ABC):
             return token_response
 
         except httpx.HTTPStatusError as e:
+            self.evict_access_token(user_id)
             raise HTTPException(status_code=HTTP_400_BAD_REQUEST, detail=f"Failed to refresh token: {e.response.text}")
         except Exception as e:
+            self.evict_access_token(user_id)
             raise HTTPException(status_code=HTTP_500_INTERNAL_SERVER_ERROR, detail=f"Token refresh failed: {str(e)}")
 
+    def get_cached_access_token(self, user_id: UUID) -> str | None:
+        """Returns the cached access token if it is not about to expire."""
+        with self._token_cache_lock:
+            cached = self._token_cache.get(user_id)
+            if not cached:
+                return None
+
+            access_token, refresh_deadline = cached
+            if time.monotonic() >= refresh_deadline:
+                self._token_cache.pop(user_id, None)
+                return None
+
+            self._token_cache.move_to_end(user_id)
+            return access_token
+
+    def cache_access_token(self, user_id: UUID, access_token: str, expires_at: datetime | None) -> None:
+        """Caches a valid access token until its expiry, for at most TOKEN_CACHE_MAX_AGE.
+
+        The expiry is converted once into a monotonic deadline (minus the refresh buffer),
+        so cache hits compare two floats instead of building timezone-aware datetimes.
+        """
+        now = time.monotonic()
+        refresh_deadline = now + TOKEN_CACHE_MAX_AGE.total_seconds()
+        if expires_at is not None:
+            remaining = expires_at - datetime.now(timezone.utc) - TOKEN_REFRESH_BUFFER
+            refresh_deadline = min(refresh_deadline, now + remaining.total_seconds())
+
+        with self._token_cache_lock:
+            self._token_cache[user_id] = (access_token, refresh_deadline)
+            self._token_cache.move_to_end(user_id)
+            while len(self._token_cache) > TOKEN_CACHE_MAX_SIZE:
+                self._token_cache.popitem(last=False)
+
+    def evict_access_token(self, user_id: UUID) -> None:
+        """Drops the cached access token, e.g. after it was rejected or the connection changed."""
+        with self._token_cache_lock:
+            self._token_cache.pop(user_id, None)
+
+    @cached_property
+    def _auth_url_parts(self) -> tuple[str, str]:
+        """Authorization URL parts that do not depend on the state, built once per instance."""
+        credentials = self.credentials
+        prefix = (
+            f"{self.endpoints.authorize_url}?"
+            f"response_type=code&"
+            f"client_id={credentials.client_id}&"
+            f"redirect_uri={credentials.redirect_uri}&"
+        )
+        scope_param = f"&scope={quote(credentials.default_scope)}" if credentials.default_scope else ""
+        return prefix, scope_param
+
     def _build_auth_url(self, state: str) -> tuple[str, dict[str, Any] | None]:
         """Builds the authorization URL.
 
@@ -141,20 +216,8 @@ class BaseOAuthTemplate(ABC):
             extra_params = f"&code_challenge={code_challenge}&code_challenge_method=S256"
             pkce_data = {"code_verifier": code_verifier}
 
-        auth_url = (
-            f"{self.endpoints.authorize_url}?"
-            f"response_type=code&"
-            f"client_id={self.credentials.client_id}&"
-            f"redirect_uri={self.credentials.redirect_uri}&"
-            f"state={state}"
-            f"{extra_params}"
-        )
-
-        if self.credentials.default_scope:
-            from urllib.parse import quote
-
-            encoded_scope = quote(self.credentials.default_scope)
-            auth_url += f"&scope={encoded_scope}"
+        prefix, scope_param = self._auth_url_parts
+        auth_url = f"{prefix}state={state}{extra_params}{scope_param}"
 
         # pkce_data will be None for non-PKCE providers
         return auth_url, pkce_data
@@ -220,14 +283,10 @@ class BaseOAuthTemplate(ABC):
         if self.use_pkce and code_verifier:
             token_data["code_verifier"] = code_verifier
 
-        if self.auth_method == AuthenticationMethod.BODY:
-            token_data["client_id"] = self.credentials.client_id
-            token_data["client_secret"] = self.credentials.client_secret
-            headers = {"Content-Type": "application/x-www-form-urlencoded"}
-        else:
-            headers = self._get_basic_auth_headers()
+        client_params, headers = self._client_auth
+        token_data.update(client_params)
 
-        return token_data, headers
+        return token_data, dict(headers)
 
     def _prepare_refresh_request(self, refresh_token: str) -> tuple[dict, dict]:
         """Prepares the token refresh request. Default implementation uses Basic Auth."""
@@ -236,14 +295,23 @@ class BaseOAuthTemplate(ABC):
             "refresh_token": refresh_token,
         }
 
+        client_params, headers = self._client_auth
+        token_data.update(client_params)
+
+        return token_data, dict(headers)
+
+    @cached_property
+    def _client_auth(self) -> tuple[Mapping[str, str], Mapping[str, str]]:
+        """Client authentication body params and headers for token requests, built once per instance.
+
+        Read-only views; callers copy them before handing them out.
+        """
         if self.auth_method == AuthenticationMethod.BODY:
-            token_data["client_id"] = self.credentials.client_id
-            token_data["client_secret"] = self.credentials.client_secret
+            credentials = self.credentials
+            client_params = {"client_id": credentials.client_id, "client_secret": credentials.client_secret}
             headers = {"Content-Type": "application/x-www-form-urlencoded"}
-        else:
-            headers = self._get_basic_auth_headers()
-
-        return token_data, headers
+            return MappingProxyType(client_params), MappingProxyType(headers)
+        return MappingProxyType({}), MappingProxyType(self._get_basic_auth_headers())
 
     def _get_basic_auth_headers(self) -> dict:
         """Generates Basic Auth headers for token requests."""
@@ -273,33 +341,16 @@ class BaseOAuthTemplate(ABC):
 
         token_expires_at = datetime.now(timezone.utc) + timedelta(seconds=token_response.expires_in)
 
-        existing_connection = self.connection_repo.get_by_user_and_provider(
-            db,
-            user_id,
-            self.provider_name,
+        connection_create = UserConnectionCreate(
+            user_id=user_id,
+            provider=self.provider_name,
+            provider_user_id=provider_user_id,
+            provider_username=provider_username,
+            access_token=token_response.access_token,
+            refresh_token=token_response.refresh_token,
+            token_expires_at=token_expires_at,
+            scope=token_response.scope,
         )
-
-        if existing_connection:
-            # Update tokens, user info, and scope
-            self.connection_repo.update_connection_info(
-                db,
-                existing_connection,
-                access_token=token_response.access_token,
-                refresh_token=token_response.refresh_token,
-                expires_in=token_response.expires_in,
-                provider_user_id=provider_user_id,
-                provider_username=provider_username,
-                scope=token_response.scope,
-            )
-        else:
-            connection_create = UserConnectionCreate(
-                user_id=user_id,
-                provider=self.provider_name,
-                provider_user_id=provider_user_id,
-                provider_username=provider_username,
-                access_token=token_response.access_token,
-                refresh_token=token_response.refresh_token,
-                token_expires_at=token_expires_at,
-                scope=token_response.scope,
-            )
-            self.connection_repo.create(db, connection_create)
+        self.connection_repo.upsert(db, connection_create)
+        # Re-authorization replaces the tokens, so a previously cached one must not be served
+        self.evict_access_token(user_id)
@@ -43,7 +43,7 @@ class Whoop247Data(Base247DataTemplate):
         headers: dict[str, str] | None = None,
     ) -> Any:
         """Make authenticated request to Whoop API."""
-        print(f"Making API request to {endpoint} with params: {params}")
+        self.logger.debug(f"Making API request to {endpoint} with params: {params}")
         return make_authenticated_request(
             db=db,
             user_id=user_id,
@@ -182,13 +182,15 @@ class Whoop247Data(Base247DataTemplate):
             "raw": raw_sleep,  # Keep raw for debugging
         }
 
-    def save_sleep_data(
+    def _build_sleep_record(
         self,
-        db: DbSession,
         user_id: UUID,
         normalized_sleep: dict[str, Any],
-    ) -> None:
-        """Save normalized sleep data to database as EventRecord with SleepDetails."""
+    ) -> tuple[EventRecordCreate, EventRecordDetailCreate] | None:
+        """Build the EventRecord and sleep detail for a normalized sleep.
+
+        Returns None if the sleep is missing its start or end time.
+        """
         sleep_id = normalized_sleep["id"]
 
         # Parse start and end times
@@ -210,7 +212,7 @@ class Whoop247Data(Base247DataTemplate):
 
         if not start_dt or not end_dt:
             self.logger.warning(f"Skipping sleep record {sleep_id}: missing start/end time")
-            return
+            return None
 
         # Create EventRecord for sleep
         record = EventRecordCreate(
@@ -252,6 +254,15 @@ class Whoop247Data(Base247DataTemplate):
             is_nap=normalized_sleep.get("is_nap", False),
         )
 
+        return record, detail
+
+    def _save_sleep_record(
+        self,
+        db: DbSession,
+        record: EventRecordCreate,
+        detail: EventRecordDetailCreate,
+    ) -> None:
+        """Save a single sleep EventRecord and its detail."""
         try:
             # Create record first
             created_record = event_record_service.create(db, record)
@@ -263,11 +274,56 @@ class Whoop247Data(Base247DataTemplate):
             # Create detail
             event_record_service.create_detail(db, detail, detail_type="sleep")
         except Exception as e:
-            self.logger.error(f"Error saving sleep record {sleep_id}: {e}")
+            self.logger.error(f"Error saving sleep record {record.id}: {e}")
             # Rollback is handled by the service/repository or session manager
             # But we should ensure we don't break the entire sync loop
             pass
 
+    def save_sleep_data(
+        self,
+        db: DbSession,
+        user_id: UUID,
+        normalized_sleep: dict[str, Any],
+    ) -> None:
+        """Save normalized sleep data to database as EventRecord with SleepDetails."""
+        sleep_record = self._build_sleep_record(user_id, normalized_sleep)
+        if sleep_record:
+            self._save_sleep_record(db, *sleep_record)
+
+    def save_sleep_data_batch(
+        self,
+        db: DbSession,
+        user_id: UUID,
+        normalized_sleeps: list[dict[str, Any]],
+    ) -> None:
+        """Save many normalized sleeps with one multi-row insert for records and details.
+
+        Sleeps that already exist are skipped. If the batch insert fails, sleeps are
+        saved one by one so a single bad record doesn't drop the whole batch.
+        """
+        sleep_records = [
+            sleep_record
+            for normalized_sleep in normalized_sleeps
+            if (sleep_record := self._build_sleep_record(user_id, normalized_sleep))
+        ]
+        if not sleep_records:
+            return
+
+        try:
+            inserted_ids = set(event_record_service.bulk_create(db, [record for record, _ in sleep_records]))
+            db.flush()
+
+            # Only insert details for records that were actually inserted (avoid FK violation)
+            details = [detail for record, detail in sleep_records if record.id in inserted_ids]
+            if details:
+                event_record_service.bulk_create_details(db, details, detail_type="sleep")
+            db.commit()
+        except Exception as e:
+            db.rollback()
+            self.logger.warning(f"Bulk sleep insert failed, saving records individually: {e}")
+            for record, detail in sleep_records:
+                self._save_sleep_record(db, record, detail)
+
     def load_and_save_sleep(
         self,
         db: DbSession,
@@ -277,15 +333,15 @@ class Whoop247Data(Base247DataTemplate):
     ) -> int:
         """Load sleep data from API and save to database."""
         raw_data = self.get_sleep_data(db, user_id, start_time, end_time)
-        count = 0
+        normalized_sleeps = []
         for item in raw_data:
             try:
-                normalized = self.normalize_sleep(item, user_id)
-                self.save_sleep_data(db, user_id, normalized)
-                count += 1
+                normalized_sleeps.append(self.normalize_sleep(item, user_id))
             except Exception as e:
-                self.logger.warning(f"Failed to save sleep data: {e}")
-        return count
+                self.logger.warning(f"Failed to normalize sleep data: {e}")
+
+        self.save_sleep_data_batch(db, user_id, normalized_sleeps)
+        return len(normalized_sleeps)
 
     def load_and_save_all(
         self,
@@ -0,0 +1,15 @@
+import json
+from typing import Any
+
+import orjson
+
+
+def json_loads(content: str | bytes) -> Any:
+    """Decode JSON with orjson, falling back to stdlib json for inputs orjson rejects (e.g. NaN, Infinity).
+
+    Raises json.JSONDecodeError for invalid JSON, like json.loads.
+    """
+    try:
+        return orjson.loads(content)
+    except orjson.JSONDecodeError:
+        return json.loads(content)
@@ -510,3 +510,14 @@ class TestAppleSDKImportEdgeCases:
         assert details.heart_rate_avg is None
         assert details.distance is None
         assert details.energy_burned is None
+
+    def test_parse_json_content(self, import_service: ImportService) -> None:
+        """Test upload bodies decode (including NaN values) and invalid JSON yields None."""
+        # Act
+        parsed = import_service._parse_json_content('{"data": {"records": [], "value": NaN}}')
+        invalid = import_service._parse_json_content("{not json")
+
+        # Assert
+        assert parsed is not None
+        assert parsed["data"]["records"] == []
+        assert invalid is None
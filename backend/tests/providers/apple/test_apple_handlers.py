@@ -3,12 +3,12 @@ Tests for Apple Health data source handlers.
 
 Tests cover:
 - AppleSourceHandler base interface
-- AutoExportHandler implementation
-- HealthKitHandler implementation
+- AutoExportHandler and HealthKitHandler implementations
 - Handler normalization methods
 - Data structure handling
 """
 
+from collections.abc import Mapping
 from typing import Any
 
 import pytest
@@ -43,26 +43,19 @@ class TestAppleSourceHandler:
         assert callable(getattr(AppleSourceHandler, "normalize"))
 
 
-class TestAutoExportHandler:
-    """Test suite for AutoExportHandler."""
+@pytest.mark.parametrize("handler_cls", [AutoExportHandler, HealthKitHandler])
+class TestAppleSourceHandlerImplementations:
+    """Test suite shared by the concrete Apple source handlers."""
 
-    def test_is_subclass_of_base_handler(self) -> None:
+    def test_is_subclass_of_base_handler(self, handler_cls: type[AppleSourceHandler]) -> None:
         """Should be a subclass of AppleSourceHandler."""
         # Assert
-        assert issubclass(AutoExportHandler, AppleSourceHandler)
+        assert issubclass(handler_cls, AppleSourceHandler)
 
-    def test_initializes_successfully(self) -> None:
-        """Should initialize without errors."""
-        # Act
-        handler = AutoExportHandler()
-
-        # Assert
-        assert handler is not None
-
-    def test_normalize_returns_list(self) -> None:
-        """Should return a list from normalize method."""
+    def test_normalize_returns_list(self, handler_cls: type[AppleSourceHandler]) -> None:
+        """Should initialize and return a list from normalize method."""
         # Arrange
-        handler = AutoExportHandler()
+        handler = handler_cls()
         data: dict[str, Any] = {}
 
         # Act
@@ -75,32 +68,7 @@ class TestAutoExportHandler:
 class TestHealthKitHandler:
     """Test suite for HealthKitHandler."""
 
-    def test_is_subclass_of_base_handler(self) -> None:
-        """Should be a subclass of AppleSourceHandler."""
-        # Assert
-        assert issubclass(HealthKitHandler, AppleSourceHandler)
-
-    def test_initializes_successfully(self) -> None:
-        """Should initialize without errors."""
-        # Act
-        handler = HealthKitHandler()
-
-        # Assert
-        assert handler is not None
-
-    def test_normalize_returns_list(self) -> None:
-        """Should return a list from normalize method."""
-        # Arrange
-        handler = HealthKitHandler()
-        data: dict[str, Any] = {}
-
-        # Act
-        result = handler.normalize(data)
-
-        # Assert
-        assert isinstance(result, list)
-
-    def test_handler_can_process_sample_workout(self, sample_apple_healthkit_workout: dict[str, Any]) -> None:
+    def test_handler_can_process_sample_workout(self, sample_apple_healthkit_workout: Mapping[str, Any]) -> None:
         """Should handle sample HealthKit workout data."""
         # Arrange
         handler = HealthKitHandler()
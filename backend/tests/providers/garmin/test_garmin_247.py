@@ -1,6 +1,8 @@
 """Tests for Garmin 247 data implementation."""
 
+from collections.abc import Mapping
 from datetime import datetime, timezone
+from types import MappingProxyType
 from typing import Any
 from unittest.mock import MagicMock, patch
 from uuid import uuid4
@@ -8,110 +10,126 @@ from uuid import uuid4
 import pytest
 from sqlalchemy.orm import Session
 
+from app.models import User
 from app.repositories.user_connection_repository import UserConnectionRepository
+from app.repositories.user_repository import UserRepository
 from app.services.providers.garmin.data_247 import Garmin247Data
 from app.services.providers.garmin.oauth import GarminOAuth
 from tests.factories import UserConnectionFactory, UserFactory
 
 
+@pytest.fixture(scope="module")
+def garmin_247() -> Garmin247Data:
+    """Create a Garmin247Data instance shared by every test in this module.
+
+    The service holds no per-test state (the OAuth token cache is keyed by user id),
+    so it is built once instead of for each test.
+    """
+    oauth = GarminOAuth(
+        user_repo=UserRepository(User),
+        connection_repo=UserConnectionRepository(),
+        provider_name="garmin",
+        api_base_url="https://apis.garmin.com",
+    )
+    return Garmin247Data(
+        provider_name="garmin",
+        api_base_url="https://apis.garmin.com",
+        oauth=oauth,
+    )
+
+
 class TestGarmin247Data:
     """Tests for Garmin247Data class."""
 
-    @pytest.fixture
-    def garmin_247(self, db: Session) -> Garmin247Data:
-        """Create Garmin247Data instance for testing."""
-        connection_repo = UserConnectionRepository()
-        oauth = GarminOAuth(
-            user_repo=MagicMock(),
-            connection_repo=connection_repo,
-            provider_name="garmin",
-            api_base_url="https://apis.garmin.com",
-        )
-        return Garmin247Data(
-            provider_name="garmin",
-            api_base_url="https://apis.garmin.com",
-            oauth=oauth,
-        )
-
-    @pytest.fixture
-    def sample_sleep(self) -> dict[str, Any]:
+    @pytest.fixture(scope="module")
+    def sample_sleep(self) -> Mapping[str, Any]:
         """Sample Garmin sleep data."""
-        return {
-            "summaryId": "sleep_123",
-            "calendarDate": "2024-01-15",
-            "startTimeInSeconds": 1705273200,  # 2024-01-14 22:00:00 UTC
-            "durationInSeconds": 28800,  # 8 hours
-            "deepSleepDurationInSeconds": 7200,  # 2 hours
-            "lightSleepDurationInSeconds": 14400,  # 4 hours
-            "remSleepInSeconds": 5400,  # 1.5 hours
-            "awakeDurationInSeconds": 1800,  # 30 minutes
-            "averageHeartRate": 58,
-            "lowestHeartRate": 48,
-            "respirationAvg": 14.5,
-            "avgOxygenSaturation": 96.5,
-            "validation": "DEVICE",
-        }
+        return MappingProxyType(
+            {
+                "summaryId": "sleep_123",
+                "calendarDate": "2024-01-15",
+                "startTimeInSeconds": 1705273200,  # 2024-01-14 22:00:00 UTC
+                "durationInSeconds": 28800,  # 8 hours
+                "deepSleepDurationInSeconds": 7200,  # 2 hours
+                "lightSleepDurationInSeconds": 14400,  # 4 hours
+                "remSleepInSeconds": 5400,  # 1.5 hours
+                "awakeDurationInSeconds": 1800,  # 30 minutes
+                "averageHeartRate": 58,
+                "lowestHeartRate": 48,
+                "respirationAvg": 14.5,
+                "avgOxygenSaturation": 96.5,
+                "validation": "DEVICE",
+            }
+        )
 
-    @pytest.fixture
-    def sample_daily(self) -> dict[str, Any]:
+    @pytest.fixture(scope="module")
+    def sample_daily(self) -> Mapping[str, Any]:
         """Sample Garmin daily summary data."""
-        return {
-            "summaryId": "daily_123",
-            "calendarDate": "2024-01-15",
-            "startTimeInSeconds": 1705276800,  # 2024-01-15 00:00:00 UTC
-            "durationInSeconds": 86400,  # 24 hours
-            "steps": 12500,
-            "distanceInMeters": 9500.5,
-            "activeKilocalories": 650,
-            "bmrKilocalories": 1800,
-            "floorsClimbed": 12,
-            "restingHeartRateInBeatsPerMinute": 55,
-            "averageHeartRateInBeatsPerMinute": 72,
-            "averageStressLevel": 35,
-            "timeOffsetHeartRateSamples": {
-                "0": 60,
-                "900": 65,
-                "1800": 70,
-            },
-        }
+        return MappingProxyType(
+            {
+                "summaryId": "daily_123",
+                "calendarDate": "2024-01-15",
+                "startTimeInSeconds": 1705276800,  # 2024-01-15 00:00:00 UTC
+                "durationInSeconds": 86400,  # 24 hours
+                "steps": 12500,
+                "distanceInMeters": 9500.5,
+                "activeKilocalories": 650,
+                "bmrKilocalories": 1800,
+                "floorsClimbed": 12,
+                "restingHeartRateInBeatsPerMinute": 55,
+                "averageHeartRateInBeatsPerMinute": 72,
+                "averageStressLevel": 35,
+                "timeOffsetHeartRateSamples": {
+                    "0": 60,
+                    "900": 65,
+                    "1800": 70,
+                },
+            }
+        )
 
-    @pytest.fixture
-    def sample_epoch(self) -> dict[str, Any]:
+    @pytest.fixture(scope="module")
+    def sample_epoch(self) -> Mapping[str, Any]:
         """Sample Garmin epoch data (15-minute interval)."""
-        return {
-            "summaryId": "epoch_123",
-            "startTimeInSeconds": 1705309200,  # 2024-01-15 09:00:00 UTC
-            "durationInSeconds": 900,  # 15 minutes
-            "steps": 250,
-            "distanceInMeters": 200.5,
-            "activeKilocalories": 15,
-            "meanHeartRateInBeatsPerMinute": 85,
-            "maxHeartRateInBeatsPerMinute": 95,
-            "intensity": "ACTIVE",
-        }
+        return MappingProxyType(
+            {
+                "summaryId": "epoch_123",
+                "startTimeInSeconds": 1705309200,  # 2024-01-15 09:00:00 UTC
+                "durationInSeconds": 900,  # 15 minutes
+                "steps": 250,
+                "distanceInMeters": 200.5,
+                "activeKilocalories": 15,
+                "meanHeartRateInBeatsPerMinute": 85,
+                "maxHeartRateInBeatsPerMinute": 95,
+                "intensity": "ACTIVE",
+            }
+        )
 
-    @pytest.fixture
-    def sample_body_comp(self) -> dict[str, Any]:
+    @pytest.fixture(scope="module")
+    def sample_body_comp(self) -> Mapping[str, Any]:
         """Sample Garmin body composition data."""
-        return {
-            "summaryId": "bodycomp_123",
-            "measurementTimeInSeconds": 1705320000,  # 2024-01-15 12:00:00 UTC
-            "weightInGrams": 75000,  # 75 kg
-            "bodyFatInPercent": 18.5,
-            "bodyMassIndex": 23.5,
-            "muscleMassInGrams": 35000,
-        }
+        return MappingProxyType(
+            {
+                "summaryId": "bodycomp_123",
+                "measurementTimeInSeconds": 1705320000,  # 2024-01-15 12:00:00 UTC
+                "weightInGrams": 75000,  # 75 kg
+                "bodyFatInPercent": 18.5,
+                "bodyMassIndex": 23.5,
+                "muscleMassInGrams": 35000,
+            }
+        )
 
     # -------------------------------------------------------------------------
     # Helper Method Tests
     # -------------------------------------------------------------------------
 
+    @pytest.mark.no_db
     def test_epoch_seconds_conversion(self, garmin_247: Garmin247Data) -> None:
         """Test datetime to Unix timestamp conversion."""
         dt = datetime(2024, 1, 15, 12, 0, 0, tzinfo=timezone.utc)
         result = garmin_247._epoch_seconds(dt)
         assert result == 1705320000
 
+    @pytest.mark.no_db
     def test_from_epoch_seconds_conversion(self, garmin_247: Garmin247Data) -> None:
         """Test Unix timestamp to datetime conversion."""
         result = garmin_247._from_epoch_seconds(1705320000)
@@ -122,60 +140,22 @@ class TestGarmin247Data:
         assert result.hour == 12
         assert result.tzinfo == timezone.utc
 
-    def test_fetch_in_chunks_single_chunk(self, garmin_247: Garmin247Data, db: Session) -> None:
-        """Test chunked fetching for date range under 24 hours."""
-        user = UserFactory()
-        UserConnectionFactory(user=user, provider="garmin")
-
+    @pytest.mark.no_db
+    def test_chunk_params(self, garmin_247: Garmin247Data) -> None:
+        """Test chunks are selected by upload time in UTC Unix seconds."""
         start = datetime(2024, 1, 15, 0, 0, 0, tzinfo=timezone.utc)
-        end = datetime(2024, 1, 15, 12, 0, 0, tzinfo=timezone.utc)  # 12 hours
-
-        with patch.object(garmin_247, "_make_api_request", return_value=[{"id": "1"}]) as mock_request:
-            result = garmin_247._fetch_in_chunks(db, user.id, "/test", start, end)
-
-            # Should make only 1 request for 12-hour range
-            assert mock_request.call_count == 1
-            assert len(result) == 1
-
-    def test_fetch_in_chunks_multiple_chunks(self, garmin_247: Garmin247Data, db: Session) -> None:
-        """Test chunked fetching for date range over 24 hours."""
-        user = UserFactory()
-        UserConnectionFactory(user=user, provider="garmin")
-
-        start = datetime(2024, 1, 1, 0, 0, 0, tzinfo=timezone.utc)
-        end = datetime(2024, 1, 3, 0, 0, 0, tzinfo=timezone.utc)  # 2 days
-
-        with patch.object(garmin_247, "_make_api_request", return_value=[{"id": "1"}]) as mock_request:
-            result = garmin_247._fetch_in_chunks(db, user.id, "/test", start, end)
-
-            # Should make 2 requests for 48-hour range (24h chunks)
-            assert mock_request.call_count == 2
-            assert len(result) == 2
-
-    def test_fetch_in_chunks_handles_errors(self, garmin_247: Garmin247Data, db: Session) -> None:
-        """Test chunked fetching continues on error."""
-        user = UserFactory()
-
-        start = datetime(2024, 1, 1, 0, 0, 0, tzinfo=timezone.utc)
-        end = datetime(2024, 1, 3, 0, 0, 0, tzinfo=timezone.utc)
+        end = datetime(2024, 1, 16, 0, 0, 0, tzinfo=timezone.utc)
 
-        # First call raises error, second succeeds
-        with patch.object(
-            garmin_247,
-            "_make_api_request",
-            side_effect=[Exception("API Error"), [{"id": "2"}]],
-        ) as mock_request:
-            result = garmin_247._fetch_in_chunks(db, user.id, "/test", start, end)
+        params = garmin_247._chunk_params(start, end)
 
-            # Should still return data from successful request
-            assert mock_request.call_count == 2
-            assert len(result) == 1
+        assert params == {"uploadStartTimeInSeconds": 1705276800, "uploadEndTimeInSeconds": 1705363200}
 
     # -------------------------------------------------------------------------
     # Sleep Data Tests
     # -------------------------------------------------------------------------
 
-    def test_normalize_sleep(self, garmin_247: Garmin247Data, sample_sleep: dict[str, Any]) -> None:
+    @pytest.mark.no_db
+    def test_normalize_sleep(self, garmin_247: Garmin247Data, sample_sleep: Mapping[str, Any]) -> None:
         """Test normalizing sleep data."""
         user_id = uuid4()
         normalized = garmin_247.normalize_sleep(sample_sleep, user_id)
@@ -197,6 +177,7 @@ class TestGarmin247Data:
         assert normalized["min_heart_rate_bpm"] == 48
         assert normalized["avg_respiration"] == 14.5
 
+    @pytest.mark.no_db
     def test_normalize_sleep_missing_stages(self, garmin_247: Garmin247Data) -> None:
         """Test normalizing sleep with missing stage data."""
         user_id = uuid4()
@@ -219,7 +200,8 @@ class TestGarmin247Data:
     # Dailies Data Tests
     # -------------------------------------------------------------------------
 
-    def test_normalize_dailies(self, garmin_247: Garmin247Data, sample_daily: dict[str, Any]) -> None:
+    @pytest.mark.no_db
+    def test_normalize_dailies(self, garmin_247: Garmin247Data, sample_daily: Mapping[str, Any]) -> None:
         """Test normalizing daily summary data."""
         user_id = uuid4()
         normalized = garmin_247.normalize_dailies(sample_daily, user_id)
@@ -237,6 +219,7 @@ class TestGarmin247Data:
         assert "heart_rate_samples" in normalized
         assert normalized["heart_rate_samples"]["0"] == 60
 
+    @pytest.mark.no_db
     def test_normalize_dailies_missing_values(self, garmin_247: Garmin247Data) -> None:
         """Test normalizing daily data with missing values."""
         user_id = uuid4()
@@ -253,11 +236,31 @@ class TestGarmin247Data:
         assert normalized["active_calories"] is None
         assert normalized["resting_heart_rate"] is None
 
+    @patch("app.repositories.data_point_series_repository.DataPointSeriesRepository.bulk_create")
+    def test_save_dailies_data_single_batch(
+        self,
+        mock_bulk_create: MagicMock,
+        garmin_247: Garmin247Data,
+        db: Session,
+        sample_daily: Mapping[str, Any],
+    ) -> None:
+        """Test daily metrics and heart rate samples are saved in one batch."""
+        user_id = uuid4()
+        normalized = garmin_247.normalize_dailies(sample_daily, user_id)
+
+        count = garmin_247.save_dailies_data(db, user_id, normalized)
+
+        # 5 daily metrics + 3 heart rate samples
+        mock_bulk_create.assert_called_once()
+        assert len(mock_bulk_create.call_args.args[1]) == 8
+        assert count == 8
+
     # -------------------------------------------------------------------------
     # Epochs Data Tests
     # -------------------------------------------------------------------------
 
-    def test_normalize_epochs(self, garmin_247: Garmin247Data, sample_epoch: dict[str, Any]) -> None:
+    @pytest.mark.no_db
+    def test_normalize_epochs(self, garmin_247: Garmin247Data, sample_epoch: Mapping[str, Any]) -> None:
         """Test normalizing epoch data."""
         user_id = uuid4()
         epochs = [sample_epoch]
@@ -274,6 +277,7 @@ class TestGarmin247Data:
         assert len(normalized["steps"]) == 1
         assert normalized["steps"][0]["value"] == 250
 
+    @pytest.mark.no_db
     def test_normalize_epochs_multiple(self, garmin_247: Garmin247Data) -> None:
         """Test normalizing multiple epochs."""
         user_id = uuid4()
@@ -303,29 +307,31 @@ class TestGarmin247Data:
     # Body Composition Tests
     # -------------------------------------------------------------------------
 
-    @patch("app.repositories.data_point_series_repository.DataPointSeriesRepository.create")
+    @patch("app.repositories.data_point_series_repository.DataPointSeriesRepository.bulk_create")
     def test_save_body_composition(
         self,
-        mock_create: MagicMock,
+        mock_bulk_create: MagicMock,
         garmin_247: Garmin247Data,
         db: Session,
-        sample_body_comp: dict[str, Any],
+        sample_body_comp: Mapping[str, Any],
     ) -> None:
         """Test saving body composition data."""
         user_id = uuid4()
 
         count = garmin_247.save_body_composition(db, user_id, sample_body_comp)
 
-        # Should create 3 data points: weight, body_fat, BMI
-        assert mock_create.call_count == 3
+        # Should insert 3 data points in one batch: weight, body_fat, BMI
+        mock_bulk_create.assert_called_once()
+        assert len(mock_bulk_create.call_args.args[1]) == 3
         assert count == 3
 
-    def test_save_body_composition_missing_timestamp(self, garmin_247: Garmin247Data, db: Session) -> None:
+    @pytest.mark.no_db
+    def test_save_body_composition_missing_timestamp(self, garmin_247: Garmin247Data) -> None:
         """Test saving body composition with missing timestamp."""
         user_id = uuid4()
         body_comp = {"summaryId": "bc_123", "weightInGrams": 75000}
 
-        count = garmin_247.save_body_composition(db, user_id, body_comp)
+        count = garmin_247.save_body_composition(MagicMock(), user_id, body_comp)
 
         # Should return 0 if no timestamp
         assert count == 0
@@ -334,16 +340,18 @@ class TestGarmin247Data:
     # Abstract Method Implementation Tests
     # -------------------------------------------------------------------------
 
-    def test_get_recovery_data_returns_empty(self, garmin_247: Garmin247Data, db: Session) -> None:
+    @pytest.mark.no_db
+    def test_get_recovery_data_returns_empty(self, garmin_247: Garmin247Data) -> None:
         """Test that get_recovery_data returns empty list (Garmin doesn't have recovery endpoint)."""
         user_id = uuid4()
         start = datetime(2024, 1, 15, tzinfo=timezone.utc)
         end = datetime(2024, 1, 16, tzinfo=timezone.utc)
 
-        result = garmin_247.get_recovery_data(db, user_id, start, end)
+        result = garmin_247.get_recovery_data(MagicMock(), user_id, start, end)
 
         assert result == []
 
+    @pytest.mark.no_db
     def test_normalize_recovery_returns_empty(self, garmin_247: Garmin247Data) -> None:
         """Test that normalize_recovery returns empty dict."""
         result = garmin_247.normalize_recovery({}, uuid4())
@@ -353,9 +361,10 @@ class TestGarmin247Data:
     # Integration Tests (with mocks)
     # -------------------------------------------------------------------------
 
-    def test_load_and_save_all_default_dates(self, garmin_247: Garmin247Data, db: Session) -> None:
+    @pytest.mark.no_db
+    def test_load_and_save_all_default_dates(self, garmin_247: Garmin247Data) -> None:
         """Test load_and_save_all triggers backfill with default date range."""
-        user = UserFactory()
+        user_id = uuid4()
 
         with (
             patch("app.integrations.celery.tasks.garmin_backfill_task.start_backfill") as mock_start_backfill,
@@ -368,15 +377,16 @@ class TestGarmin247Data:
                 "end_time": "2024-01-15T00:00:00+00:00",
             }
 
-            results = garmin_247.load_and_save_all(db, user.id)
+            results = garmin_247.load_and_save_all(MagicMock(), user_id)
 
             assert results["backfill_triggered"] is True
             assert "sleeps" in results["triggered_types"]
             mock_start_backfill.assert_called_once()
 
-    def test_load_and_save_all_custom_dates(self, garmin_247: Garmin247Data, db: Session) -> None:
+    @pytest.mark.no_db
+    def test_load_and_save_all_custom_dates(self, garmin_247: Garmin247Data) -> None:
         """Test load_and_save_all with custom date range."""
-        user = UserFactory()
+        user_id = uuid4()
 
         start = datetime(2024, 1, 1, tzinfo=timezone.utc)
         end = datetime(2024, 1, 7, tzinfo=timezone.utc)
@@ -392,7 +402,7 @@ class TestGarmin247Data:
                 "end_time": end.isoformat(),
             }
 
-            results = garmin_247.load_and_save_all(db, user.id, start_time=start, end_time=end)
+            results = garmin_247.load_and_save_all(MagicMock(), user_id, start_time=start, end_time=end)
 
             # Verify custom dates were used
             mock_trigger.assert_called_once()
@@ -402,9 +412,10 @@ class TestGarmin247Data:
 
             assert results["backfill_triggered"] is True
 
-    def test_load_and_save_all_string_dates(self, garmin_247: Garmin247Data, db: Session) -> None:
+    @pytest.mark.no_db
+    def test_load_and_save_all_string_dates(self, garmin_247: Garmin247Data) -> None:
         """Test load_and_save_all with ISO string dates."""
-        user = UserFactory()
+        user_id = uuid4()
 
         with (
             patch("app.integrations.celery.tasks.garmin_backfill_task.start_backfill"),
@@ -418,17 +429,18 @@ class TestGarmin247Data:
             }
 
             results = garmin_247.load_and_save_all(
-                db,
-                user.id,
+                MagicMock(),
+                user_id,
                 start_time="2024-01-01T00:00:00Z",
                 end_time="2024-01-07T00:00:00Z",
             )
 
             assert results["backfill_triggered"] is True
 
-    def test_load_and_save_all_handles_errors(self, garmin_247: Garmin247Data, db: Session) -> None:
+    @pytest.mark.no_db
+    def test_load_and_save_all_handles_errors(self, garmin_247: Garmin247Data) -> None:
         """Test load_and_save_all handles errors from backfill service."""
-        user = UserFactory()
+        user_id = uuid4()
 
         with (
             patch("app.integrations.celery.tasks.garmin_backfill_task.start_backfill"),
@@ -441,7 +453,7 @@ class TestGarmin247Data:
                 "end_time": "2024-01-15T00:00:00+00:00",
             }
 
-            results = garmin_247.load_and_save_all(db, user.id)
+            results = garmin_247.load_and_save_all(MagicMock(), user_id)
 
             # Should still return with backfill_triggered
             assert results["backfill_triggered"] is True
@@ -452,62 +464,62 @@ class TestGarmin247Data:
     # HRV Data Tests
     # -------------------------------------------------------------------------
 
-    def test_save_hrv_data(self, garmin_247: Garmin247Data, db: Session) -> None:
+    @pytest.mark.parametrize(
+        ("hrv_data", "expected_count"),
+        [
+            pytest.param(
+                {
+                    "userId": "garmin_user_123",
+                    "summaryId": "hrv-123",
+                    "calendarDate": "2026-01-14",
+                    "lastNightAvg": 84,
+                    "lastNight5MinHigh": 124,
+                    "startTimeOffsetInSeconds": 3600,
+                    "durationInSeconds": 36565,
+                    "startTimeInSeconds": 1768340715,
+                    "hrvValues": {
+                        "265": 70,
+                        "565": 73,
+                        "865": 68,
+                    },
+                },
+                4,  # 1 lastNightAvg + 3 hrvValues
+                id="avg_and_values",
+            ),
+            pytest.param(
+                {
+                    "userId": "garmin_user_123",
+                    "lastNightAvg": 84,
+                    # Missing startTimeInSeconds
+                },
+                0,
+                id="missing_start_time",
+            ),
+            pytest.param(
+                {
+                    "userId": "garmin_user_123",
+                    "summaryId": "hrv-123",
+                    "calendarDate": "2026-01-14",
+                    "lastNightAvg": 84,
+                    "startTimeInSeconds": 1768340715,
+                    # No hrvValues
+                },
+                1,  # Just the lastNightAvg
+                id="only_avg",
+            ),
+        ],
+    )
+    def test_save_hrv_data(
+        self,
+        garmin_247: Garmin247Data,
+        db: Session,
+        hrv_data: dict[str, Any],
+        expected_count: int,
+    ) -> None:
         """Test saving HRV data."""
         user = UserFactory()
         UserConnectionFactory(user=user, provider="garmin")
 
-        hrv_data = {
-            "userId": "garmin_user_123",
-            "summaryId": "hrv-123",
-            "calendarDate": "2026-01-14",
-            "lastNightAvg": 84,
-            "lastNight5MinHigh": 124,
-            "startTimeOffsetInSeconds": 3600,
-            "durationInSeconds": 36565,
-            "startTimeInSeconds": 1768340715,
-            "hrvValues": {
-                "265": 70,
-                "565": 73,
-                "865": 68,
-            },
-        }
-
-        count = garmin_247.save_hrv_data(db, user.id, hrv_data)
-
-        # Should save 1 lastNightAvg + 3 hrvValues = 4 records
-        assert count == 4
-
-    def test_save_hrv_data_missing_start_time(self, garmin_247: Garmin247Data, db: Session) -> None:
-        """Test saving HRV data with missing start time."""
-        user = UserFactory()
-        UserConnectionFactory(user=user, provider="garmin")
-
-        hrv_data = {
-            "userId": "garmin_user_123",
-            "lastNightAvg": 84,
-            # Missing startTimeInSeconds
-        }
-
-        count = garmin_247.save_hrv_data(db, user.id, hrv_data)
-
-        assert count == 0
-
-    def test_save_hrv_data_only_avg(self, garmin_247: Garmin247Data, db: Session) -> None:
-        """Test saving HRV data with only lastNightAvg."""
-        user = UserFactory()
-        UserConnectionFactory(user=user, provider="garmin")
-
-        hrv_data = {
-            "userId": "garmin_user_123",
-            "summaryId": "hrv-123",
-            "calendarDate": "2026-01-14",
-            "lastNightAvg": 84,
-            "startTimeInSeconds": 1768340715,
-            # No hrvValues
-        }
-
         count = garmin_247.save_hrv_data(db, user.id, hrv_data)
 
-        # Should save just the lastNightAvg
-        assert count == 1
+        assert count == expected_count
@@ -1,35 +1,63 @@
 """Tests for Garmin OAuth implementation."""
 
-from unittest.mock import MagicMock, patch
+from typing import Any, Mapping
+from unittest.mock import MagicMock, PropertyMock, patch
 from uuid import uuid4
 
 import httpx
 import pytest
 from sqlalchemy.orm import Session
 
-from app.models import User
+from app.models import User, UserConnection
 from app.repositories.user_connection_repository import UserConnectionRepository
 from app.repositories.user_repository import UserRepository
 from app.schemas import AuthenticationMethod, OAuthTokenResponse, ProviderCredentials, ProviderEndpoints
 from app.services.providers.garmin.oauth import GarminOAuth
-from tests.factories import UserConnectionFactory, UserFactory
 
 
-class TestGarminOAuth:
-    """Tests for GarminOAuth class."""
+class _FakeResponse:
+    """Minimal stand-in for httpx.Response, cheaper to build than a MagicMock."""
+
+    def __init__(self, payload: dict[str, Any]) -> None:
+        self._payload = payload
+
+    def json(self) -> dict[str, Any]:
+        return self._payload
+
+    def raise_for_status(self) -> None:
+        return None
 
-    @pytest.fixture
-    def garmin_oauth(self, db: Session) -> GarminOAuth:
-        """Create GarminOAuth instance for testing."""
-        user_repo = UserRepository(User)
-        connection_repo = UserConnectionRepository()
+
+@pytest.fixture(scope="module")
+def garmin_oauth() -> GarminOAuth:
+    """Create a GarminOAuth instance shared by every test in this module.
+
+    Built before the function-scoped Redis mock applies, so it gets its own mocked Redis client.
+    """
+    with patch("app.services.providers.templates.base_oauth.get_redis_client", return_value=MagicMock()):
         return GarminOAuth(
-            user_repo=user_repo,
-            connection_repo=connection_repo,
+            user_repo=UserRepository(User),
+            connection_repo=UserConnectionRepository(),
             provider_name="garmin",
             api_base_url="https://apis.garmin.com",
         )
 
+
+@pytest.fixture(scope="module")
+def token_response() -> OAuthTokenResponse:
+    """Token response shared by the user info tests."""
+    return OAuthTokenResponse(
+        access_token="test_access_token",
+        token_type="Bearer",
+        expires_in=3600,
+        refresh_token="test_refresh_token",
+    )
+
+
+@pytest.mark.no_db
+class TestGarminOAuth:
+    """Tests for GarminOAuth class."""
+
     def test_endpoints_configuration(self, garmin_oauth: GarminOAuth) -> None:
         """Test OAuth endpoints are correctly configured."""
         endpoints = garmin_oauth.endpoints
@@ -53,14 +81,9 @@ class TestGarminOAuth:
         """Garmin should use body authentication method."""
         assert garmin_oauth.auth_method == AuthenticationMethod.BODY
 
-    @patch("app.integrations.redis_client.get_redis_client")
-    def test_get_authorization_url(self, mock_redis: MagicMock, garmin_oauth: GarminOAuth) -> None:
+    def test_get_authorization_url(self, garmin_oauth: GarminOAuth) -> None:
         """Test generating authorization URL with PKCE."""
         # Arrange
-        mock_redis_client = MagicMock()
-        mock_redis.return_value = mock_redis_client
-        garmin_oauth.redis_client = mock_redis_client
-
         user_id = uuid4()
 
         # Act
@@ -73,27 +96,32 @@ class TestGarminOAuth:
         assert "code_challenge=" in auth_url
         assert "code_challenge_method=S256" in auth_url
         assert len(state) > 0
-        mock_redis_client.setex.assert_called_once()
+        assert garmin_oauth.redis_client.setex.call_args.args[0] == f"oauth_state:{state}"
+
+    def test_authorization_url_static_parts_built_once(self, garmin_oauth: GarminOAuth) -> None:
+        """Test credentials are not rebuilt for every authorization URL."""
+        # Arrange
+        first_url, _ = garmin_oauth.get_authorization_url(uuid4())
+
+        # Act
+        with patch.object(GarminOAuth, "credentials", new_callable=PropertyMock) as mock_credentials:
+            auth_url, state = garmin_oauth.get_authorization_url(uuid4())
+
+        # Assert
+        mock_credentials.assert_not_called()
+        assert f"state={state}" in auth_url
+        assert auth_url.split("state=")[0] == first_url.split("state=")[0]
 
     @patch("httpx.get")
     def test_get_provider_user_info_success(
         self,
         mock_httpx_get: MagicMock,
         garmin_oauth: GarminOAuth,
+        token_response: OAuthTokenResponse,
     ) -> None:
         """Test fetching Garmin user info successfully."""
         # Arrange
-        token_response = OAuthTokenResponse(
-            access_token="test_access_token",
-            token_type="Bearer",
-            expires_in=3600,
-            refresh_token="test_refresh_token",
-        )
-
-        mock_response = MagicMock()
-        mock_response.json.return_value = {"userId": "garmin_user_123"}
-        mock_response.raise_for_status.return_value = None
-        mock_httpx_get.return_value = mock_response
+        mock_httpx_get.return_value = _FakeResponse({"userId": "garmin_user_123"})
 
         # Act
         user_info = garmin_oauth._get_provider_user_info(token_response, "internal_user_id")
@@ -112,16 +140,10 @@ class TestGarminOAuth:
         self,
         mock_httpx_get: MagicMock,
         garmin_oauth: GarminOAuth,
+        token_response: OAuthTokenResponse,
     ) -> None:
         """Test fetching Garmin user info handles errors gracefully."""
         # Arrange
-        token_response = OAuthTokenResponse(
-            access_token="test_access_token",
-            token_type="Bearer",
-            expires_in=3600,
-            refresh_token="test_refresh_token",
-        )
-
         mock_httpx_get.side_effect = httpx.HTTPError("API Error")
 
         # Act
@@ -138,18 +160,11 @@ class TestGarminOAuth:
         mock_redis: MagicMock,
         mock_httpx_post: MagicMock,
         garmin_oauth: GarminOAuth,
+        mock_oauth_token_response: Mapping[str, Any],
     ) -> None:
         """Test token exchange includes PKCE verifier."""
         # Arrange
-        mock_response = MagicMock()
-        mock_response.json.return_value = {
-            "access_token": "new_access_token",
-            "refresh_token": "new_refresh_token",
-            "expires_in": 3600,
-            "token_type": "Bearer",
-        }
-        mock_response.raise_for_status.return_value = None
-        mock_httpx_post.return_value = mock_response
+        mock_httpx_post.return_value = _FakeResponse(dict(mock_oauth_token_response))
 
         code = "auth_code_123"
         code_verifier = "test_verifier_abc123"
@@ -158,8 +173,8 @@ class TestGarminOAuth:
         token_response = garmin_oauth._exchange_token(code, code_verifier)
 
         # Assert
-        assert token_response.access_token == "new_access_token"
-        assert token_response.refresh_token == "new_refresh_token"
+        assert token_response.access_token == mock_oauth_token_response["access_token"]
+        assert token_response.refresh_token == mock_oauth_token_response["refresh_token"]
 
         # Verify PKCE verifier was included in request
         call_args = mock_httpx_post.call_args
@@ -170,34 +185,24 @@ class TestGarminOAuth:
         self,
         mock_httpx_post: MagicMock,
         garmin_oauth: GarminOAuth,
-        db: Session,
+        mock_oauth_refresh_response: Mapping[str, Any],
     ) -> None:
         """Test refreshing access token."""
         # Arrange
-        user = UserFactory()
-        UserConnectionFactory(
-            user=user,
-            provider="garmin",
-            access_token="old_access_token",
-            refresh_token="old_refresh_token",
-        )
+        connection = MagicMock(spec=UserConnection)
+        connection.refresh_token = "old_refresh_token"
 
-        mock_response = MagicMock()
-        mock_response.json.return_value = {
-            "access_token": "new_access_token",
-            "refresh_token": "new_refresh_token",
-            "expires_in": 3600,
-            "token_type": "Bearer",
-        }
-        mock_response.raise_for_status.return_value = None
-        mock_httpx_post.return_value = mock_response
+        mock_httpx_post.return_value = _FakeResponse(dict(mock_oauth_refresh_response))
 
         # Act
-        token_response = garmin_oauth.refresh_access_token(db, user.id, "old_refresh_token")
+        with patch.object(UserConnectionRepository, "get_by_user_and_provider", return_value=connection):
+            token_response = garmin_oauth.refresh_access_token(MagicMock(spec=Session), uuid4(), "old_refresh_token")
 
         # Assert
-        assert token_response.access_token == "new_access_token"
-        assert token_response.refresh_token == "new_refresh_token"
+        assert token_response.access_token == mock_oauth_refresh_response["access_token"]
+        assert token_response.refresh_token == mock_oauth_refresh_response["refresh_token"]
+        assert connection.access_token == mock_oauth_refresh_response["access_token"]
+        assert connection.refresh_token == mock_oauth_refresh_response["refresh_token"]
 
     def test_prepare_token_request_uses_body_auth(self, garmin_oauth: GarminOAuth) -> None:
         """Test token request preparation uses body authentication."""
@@ -225,3 +230,30 @@ class TestGarminOAuth:
         assert data["refresh_token"] == "test_refresh_token"
         assert headers["Content-Type"] == "application/x-www-form-urlencoded"
         assert "Authorization" not in headers  # Body auth, not Basic auth
+
+    def test_token_request_client_auth_built_once(self, garmin_oauth: GarminOAuth) -> None:
+        """Test client credentials are not rebuilt for every token request."""
+        # Arrange
+        garmin_oauth._prepare_refresh_request("first_refresh_token")
+
+        # Act
+        with patch.object(GarminOAuth, "credentials", new_callable=PropertyMock) as mock_credentials:
+            data, _ = garmin_oauth._prepare_refresh_request("second_refresh_token")
+
+        # Assert
+        mock_credentials.assert_not_called()
+        assert data["refresh_token"] == "second_refresh_token"
+        assert data["client_id"] is not None
+
+    def test_token_request_returns_fresh_headers(self, garmin_oauth: GarminOAuth) -> None:
+        """Test mutating returned headers does not leak into later token requests."""
+        # Arrange
+        _, headers = garmin_oauth._prepare_refresh_request("first_refresh_token")
+        headers["X-Leaked"] = "1"
+
+        # Act
+        _, next_headers = garmin_oauth._prepare_token_request("auth_code", None)
+
+        # Assert
+        assert "X-Leaked" not in next_headers
+        assert next_headers is not headers
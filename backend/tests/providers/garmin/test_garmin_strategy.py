@@ -1,77 +1,56 @@
 """Tests for Garmin strategy."""
 
+from operator import attrgetter
+from typing import Any
+
+import pytest
+
 from app.services.providers.garmin.oauth import GarminOAuth
 from app.services.providers.garmin.strategy import GarminStrategy
 from app.services.providers.garmin.workouts import GarminWorkouts
 
 
-class TestGarminStrategy:
-    """Tests for GarminStrategy class."""
-
-    def test_name_is_garmin(self) -> None:
-        """Strategy name should be 'garmin'."""
-        strategy = GarminStrategy()
-        assert strategy.name == "garmin"
-
-    def test_api_base_url(self) -> None:
-        """API base URL should be Garmin's API endpoint."""
-        strategy = GarminStrategy()
-        assert strategy.api_base_url == "https://apis.garmin.com"
-
-    def test_display_name(self) -> None:
-        """Display name should be capitalized provider name."""
-        strategy = GarminStrategy()
-        assert strategy.display_name == "Garmin"
-
-    def test_has_cloud_api(self) -> None:
-        """Garmin should have cloud API support."""
-        strategy = GarminStrategy()
-        assert strategy.has_cloud_api is True
+@pytest.fixture(scope="module")
+def strategy() -> GarminStrategy:
+    """Create a GarminStrategy shared by every test in this module."""
+    return GarminStrategy()
 
-    def test_icon_url(self) -> None:
-        """Icon URL should point to Garmin SVG icon."""
-        strategy = GarminStrategy()
-        assert strategy.icon_url == "/static/provider-icons/garmin.svg"
 
-    def test_oauth_component_initialized(self) -> None:
-        """OAuth component should be initialized."""
-        strategy = GarminStrategy()
-        assert strategy.oauth is not None
-        assert isinstance(strategy.oauth, GarminOAuth)
-
-    def test_workouts_component_initialized(self) -> None:
-        """Workouts component should be initialized."""
-        strategy = GarminStrategy()
-        assert strategy.workouts is not None
-        assert isinstance(strategy.workouts, GarminWorkouts)
-
-    def test_oauth_has_correct_provider_name(self) -> None:
-        """OAuth component should have correct provider name."""
-        strategy = GarminStrategy()
-        assert strategy.oauth is not None
-        assert strategy.oauth.provider_name == "garmin"
-
-    def test_oauth_has_correct_api_base_url(self) -> None:
-        """OAuth component should have correct API base URL."""
-        strategy = GarminStrategy()
-        assert strategy.oauth is not None
-        assert strategy.oauth.api_base_url == "https://apis.garmin.com"
-
-    def test_workouts_has_correct_provider_name(self) -> None:
-        """Workouts component should have correct provider name."""
-        strategy = GarminStrategy()
-        assert strategy.workouts is not None
-        assert strategy.workouts.provider_name == "garmin"
-
-    def test_workouts_has_correct_api_base_url(self) -> None:
-        """Workouts component should have correct API base URL."""
-        strategy = GarminStrategy()
-        assert strategy.workouts is not None
-        assert strategy.workouts.api_base_url == "https://apis.garmin.com"
+@pytest.mark.no_db
+class TestGarminStrategy:
+    """Tests for GarminStrategy class."""
 
-    def test_repositories_initialized(self) -> None:
+    @pytest.mark.parametrize(
+        ("attr", "expected"),
+        [
+            ("name", "garmin"),
+            ("api_base_url", "https://apis.garmin.com"),
+            ("display_name", "Garmin"),
+            ("has_cloud_api", True),
+            ("icon_url", "/static/provider-icons/garmin.svg"),
+            ("oauth.provider_name", "garmin"),
+            ("oauth.api_base_url", "https://apis.garmin.com"),
+            ("workouts.provider_name", "garmin"),
+            ("workouts.api_base_url", "https://apis.garmin.com"),
+        ],
+    )
+    def test_attributes(self, strategy: GarminStrategy, attr: str, expected: Any) -> None:
+        """Strategy and its components should expose Garmin's configuration."""
+        assert attrgetter(attr)(strategy) == expected
+
+    @pytest.mark.parametrize(
+        ("attr", "expected_type"),
+        [
+            ("oauth", GarminOAuth),
+            ("workouts", GarminWorkouts),
+        ],
+    )
+    def test_components_initialized(self, strategy: GarminStrategy, attr: str, expected_type: type) -> None:
+        """OAuth and workouts components should be initialized."""
+        assert isinstance(getattr(strategy, attr), expected_type)
+
+    def test_repositories_initialized(self, strategy: GarminStrategy) -> None:
         """All required repositories should be initialized."""
-        strategy = GarminStrategy()
         assert strategy.user_repo is not None
         assert strategy.connection_repo is not None
         assert strategy.workout_repo is not None
@@ -3,15 +3,16 @@
 from datetime import datetime, timezone
 from decimal import Decimal
 from typing import Any
-from unittest.mock import MagicMock, patch
+from unittest.mock import patch
 from uuid import uuid4
 
 import pytest
 from sqlalchemy.orm import Session
 
-from app.models import EventRecord
+from app.models import EventRecord, User
 from app.repositories.event_record_repository import EventRecordRepository
 from app.repositories.user_connection_repository import UserConnectionRepository
+from app.repositories.user_repository import UserRepository
 from app.schemas import EventRecordCreate, EventRecordDetailCreate, GarminActivityJSON
 from app.schemas.workout_types import WorkoutType
 from app.services.providers.garmin.oauth import GarminOAuth
@@ -28,7 +29,7 @@ class TestGarminWorkouts:
         workout_repo = EventRecordRepository(EventRecord)
         connection_repo = UserConnectionRepository()
         oauth = GarminOAuth(
-            user_repo=MagicMock(),
+            user_repo=UserRepository(User),
             connection_repo=connection_repo,
             provider_name="garmin",
             api_base_url="https://apis.garmin.com",
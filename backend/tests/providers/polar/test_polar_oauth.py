@@ -7,23 +7,24 @@ Tests the PolarOAuth class for OAuth 2.0 authentication flow with Polar API.
 from unittest.mock import MagicMock, patch
 
 import httpx
-from sqlalchemy.orm import Session
+import pytest
 
+from app.models import User
+from app.repositories.user_connection_repository import UserConnectionRepository
+from app.repositories.user_repository import UserRepository
 from app.schemas import OAuthTokenResponse
+from app.schemas.oauth import AuthenticationMethod
 from app.services.providers.polar.oauth import PolarOAuth
 from tests.factories import UserFactory
 
 
+@pytest.mark.no_db
 class TestPolarOAuthConfiguration:
     """Tests for Polar OAuth configuration and endpoints."""
 
-    def test_polar_oauth_endpoints(self, db: Session) -> None:
+    def test_polar_oauth_endpoints(self) -> None:
         """Test Polar OAuth endpoints are configured correctly."""
         # Arrange
-        from app.models import User
-        from app.repositories.user_connection_repository import UserConnectionRepository
-        from app.repositories.user_repository import UserRepository
-
         user_repo = UserRepository(User)
         connection_repo = UserConnectionRepository()
         oauth = PolarOAuth(
@@ -40,13 +41,9 @@ class TestPolarOAuthConfiguration:
         assert endpoints.authorize_url == "https://flow.polar.com/oauth2/authorization"
         assert endpoints.token_url == "https://polarremote.com/v2/oauth2/token"
 
-    def test_polar_oauth_credentials_structure(self, db: Session) -> None:
+    def test_polar_oauth_credentials_structure(self) -> None:
         """Test Polar OAuth credentials are structured correctly."""
         # Arrange
-        from app.models import User
-        from app.repositories.user_connection_repository import UserConnectionRepository
-        from app.repositories.user_repository import UserRepository
-
         user_repo = UserRepository(User)
         connection_repo = UserConnectionRepository()
         oauth = PolarOAuth(
@@ -66,14 +63,9 @@ class TestPolarOAuthConfiguration:
         assert isinstance(credentials.client_id, str)
         assert isinstance(credentials.client_secret, str)
 
-    def test_polar_oauth_uses_basic_auth(self, db: Session) -> None:
+    def test_polar_oauth_uses_basic_auth(self) -> None:
         """Test Polar OAuth uses Basic Authentication method."""
         # Arrange
-        from app.models import User
-        from app.repositories.user_connection_repository import UserConnectionRepository
-        from app.repositories.user_repository import UserRepository
-        from app.schemas.oauth import AuthenticationMethod
-
         user_repo = UserRepository(User)
         connection_repo = UserConnectionRepository()
         oauth = PolarOAuth(
@@ -86,13 +78,9 @@ class TestPolarOAuthConfiguration:
         # Assert
         assert oauth.auth_method == AuthenticationMethod.BASIC_AUTH
 
-    def test_polar_oauth_does_not_use_pkce(self, db: Session) -> None:
+    def test_polar_oauth_does_not_use_pkce(self) -> None:
         """Test Polar OAuth does not use PKCE."""
         # Arrange
-        from app.models import User
-        from app.repositories.user_connection_repository import UserConnectionRepository
-        from app.repositories.user_repository import UserRepository
-
         user_repo = UserRepository(User)
         connection_repo = UserConnectionRepository()
         oauth = PolarOAuth(
@@ -106,18 +94,15 @@ class TestPolarOAuthConfiguration:
         assert oauth.use_pkce is False
 
 
+@pytest.mark.no_db
 class TestPolarOAuthAuthorization:
     """Tests for Polar OAuth authorization URL generation."""
 
     @patch("app.services.providers.templates.base_oauth.get_redis_client")
-    def test_get_authorization_url(self, mock_redis_client: MagicMock, db: Session) -> None:
+    def test_get_authorization_url(self, mock_redis_client: MagicMock) -> None:
         """Test generating authorization URL for Polar."""
         # Arrange
-        from app.models import User
-        from app.repositories.user_connection_repository import UserConnectionRepository
-        from app.repositories.user_repository import UserRepository
-
-        user = UserFactory()
+        user = UserFactory.build()
         user_repo = UserRepository(User)
         connection_repo = UserConnectionRepository()
 
@@ -153,14 +138,10 @@ class TestPolarOAuthAuthorization:
         assert str(user.id) in call_args[0][2]  # State contains user_id
 
     @patch("app.integrations.redis_client.get_redis_client")
-    def test_authorization_url_includes_scope(self, mock_redis_client: MagicMock, db: Session) -> None:
+    def test_authorization_url_includes_scope(self, mock_redis_client: MagicMock) -> None:
         """Test authorization URL includes default scope."""
         # Arrange
-        from app.models import User
-        from app.repositories.user_connection_repository import UserConnectionRepository
-        from app.repositories.user_repository import UserRepository
-
-        user = UserFactory()
+        user = UserFactory.build()
         user_repo = UserRepository(User)
         connection_repo = UserConnectionRepository()
 
@@ -184,18 +165,15 @@ class TestPolarOAuthAuthorization:
             assert "scope=" in auth_url
 
 
+@pytest.mark.no_db
 class TestPolarOAuthUserInfo:
     """Tests for extracting Polar user info from token response."""
 
     @patch("httpx.post")
-    def test_get_provider_user_info_with_x_user_id(self, mock_post: MagicMock, db: Session) -> None:
+    def test_get_provider_user_info_with_x_user_id(self, mock_post: MagicMock) -> None:
         """Test extracting user info when x_user_id is present."""
         # Arrange
-        from app.models import User
-        from app.repositories.user_connection_repository import UserConnectionRepository
-        from app.repositories.user_repository import UserRepository
-
-        user = UserFactory()
+        user = UserFactory.build()
         user_repo = UserRepository(User)
         connection_repo = UserConnectionRepository()
 
@@ -227,14 +205,10 @@ class TestPolarOAuthUserInfo:
         assert user_info["username"] is None
         mock_post.assert_called_once()
 
-    def test_get_provider_user_info_without_x_user_id(self, db: Session) -> None:
+    def test_get_provider_user_info_without_x_user_id(self) -> None:
         """Test extracting user info when x_user_id is None."""
         # Arrange
-        from app.models import User
-        from app.repositories.user_connection_repository import UserConnectionRepository
-        from app.repositories.user_repository import UserRepository
-
-        user = UserFactory()
+        user = UserFactory.build()
         user_repo = UserRepository(User)
         connection_repo = UserConnectionRepository()
 
@@ -261,18 +235,15 @@ class TestPolarOAuthUserInfo:
         assert user_info["username"] is None
 
 
+@pytest.mark.no_db
 class TestPolarUserRegistration:
     """Tests for Polar user registration API call."""
 
     @patch("httpx.post")
-    def test_register_user_success(self, mock_post: MagicMock, db: Session) -> None:
+    def test_register_user_success(self, mock_post: MagicMock) -> None:
         """Test successful user registration with Polar API."""
         # Arrange
-        from app.models import User
-        from app.repositories.user_connection_repository import UserConnectionRepository
-        from app.repositories.user_repository import UserRepository
-
-        user = UserFactory()
+        user = UserFactory.build()
         user_repo = UserRepository(User)
         connection_repo = UserConnectionRepository()
 
@@ -299,14 +270,10 @@ class TestPolarUserRegistration:
         assert call_args[1]["json"]["member-id"] == str(user.id)
 
     @patch("httpx.post")
-    def test_register_user_handles_failure_gracefully(self, mock_post: MagicMock, db: Session) -> None:
+    def test_register_user_handles_failure_gracefully(self, mock_post: MagicMock) -> None:
         """Test user registration handles API errors without raising exceptions."""
         # Arrange
-        from app.models import User
-        from app.repositories.user_connection_repository import UserConnectionRepository
-        from app.repositories.user_repository import UserRepository
-
-        user = UserFactory()
+        user = UserFactory.build()
         user_repo = UserRepository(User)
         connection_repo = UserConnectionRepository()
 
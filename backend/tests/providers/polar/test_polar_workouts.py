@@ -4,15 +4,22 @@ Tests for Polar workouts implementation.
 Tests the PolarWorkouts class for fetching and processing workout data from Polar API.
 """
 
+from collections.abc import Mapping
 from datetime import datetime
 from decimal import Decimal
+from typing import Any
 from unittest.mock import MagicMock, patch
 
 import pytest
 from sqlalchemy.orm import Session
 
+from app.models import EventRecord, User
+from app.repositories.event_record_repository import EventRecordRepository
+from app.repositories.user_connection_repository import UserConnectionRepository
+from app.repositories.user_repository import UserRepository
 from app.schemas import PolarExerciseJSON
 from app.schemas.workout_types import WorkoutType
+from app.services.providers.polar.oauth import PolarOAuth
 from app.services.providers.polar.workouts import PolarWorkouts
 from tests.factories import UserConnectionFactory, UserFactory
 
@@ -23,12 +30,6 @@ class TestPolarWorkoutsInitialization:
     def test_polar_workouts_initialization(self, db: Session) -> None:
         """Test PolarWorkouts initializes with required dependencies."""
         # Arrange
-        from app.models import EventRecord, User
-        from app.repositories.event_record_repository import EventRecordRepository
-        from app.repositories.user_connection_repository import UserConnectionRepository
-        from app.repositories.user_repository import UserRepository
-        from app.services.providers.polar.oauth import PolarOAuth
-
         user_repo = UserRepository(User)
         connection_repo = UserConnectionRepository()
         workout_repo = EventRecordRepository(EventRecord)
@@ -61,12 +62,6 @@ class TestPolarWorkoutsDateExtraction:
     def test_extract_dates_with_offset_positive_offset(self, db: Session) -> None:
         """Test extracting dates with positive UTC offset."""
         # Arrange
-        from app.models import EventRecord, User
-        from app.repositories.event_record_repository import EventRecordRepository
-        from app.repositories.user_connection_repository import UserConnectionRepository
-        from app.repositories.user_repository import UserRepository
-        from app.services.providers.polar.oauth import PolarOAuth
-
         user_repo = UserRepository(User)
         connection_repo = UserConnectionRepository()
         workout_repo = EventRecordRepository(EventRecord)
@@ -100,12 +95,6 @@ class TestPolarWorkoutsDateExtraction:
     def test_extract_dates_with_offset_negative_offset(self, db: Session) -> None:
         """Test extracting dates with negative UTC offset."""
         # Arrange
-        from app.models import EventRecord, User
-        from app.repositories.event_record_repository import EventRecordRepository
-        from app.repositories.user_connection_repository import UserConnectionRepository
-        from app.repositories.user_repository import UserRepository
-        from app.services.providers.polar.oauth import PolarOAuth
-
         user_repo = UserRepository(User)
         connection_repo = UserConnectionRepository()
         workout_repo = EventRecordRepository(EventRecord)
@@ -138,12 +127,6 @@ class TestPolarWorkoutsDateExtraction:
     def test_extract_dates_not_implemented_fallback(self, db: Session) -> None:
         """Test that _extract_dates raises NotImplementedError for Polar."""
         # Arrange
-        from app.models import EventRecord, User
-        from app.repositories.event_record_repository import EventRecordRepository
-        from app.repositories.user_connection_repository import UserConnectionRepository
-        from app.repositories.user_repository import UserRepository
-        from app.services.providers.polar.oauth import PolarOAuth
-
         user_repo = UserRepository(User)
         connection_repo = UserConnectionRepository()
         workout_repo = EventRecordRepository(EventRecord)
@@ -169,15 +152,9 @@ class TestPolarWorkoutsDateExtraction:
 class TestPolarWorkoutsMetricsBuilding:
     """Tests for building metrics from Polar exercise data."""
 
-    def test_build_metrics_with_heart_rate_data(self, db: Session, sample_polar_exercise: dict) -> None:
+    def test_build_metrics_with_heart_rate_data(self, db: Session, sample_polar_exercise: Mapping[str, Any]) -> None:
         """Test building metrics with complete heart rate data."""
         # Arrange
-        from app.models import EventRecord, User
-        from app.repositories.event_record_repository import EventRecordRepository
-        from app.repositories.user_connection_repository import UserConnectionRepository
-        from app.repositories.user_repository import UserRepository
-        from app.services.providers.polar.oauth import PolarOAuth
-
         user_repo = UserRepository(User)
         connection_repo = UserConnectionRepository()
         workout_repo = EventRecordRepository(EventRecord)
@@ -211,12 +188,6 @@ class TestPolarWorkoutsMetricsBuilding:
     def test_build_metrics_without_heart_rate_data(self, db: Session) -> None:
         """Test building metrics when heart rate data is missing."""
         # Arrange
-        from app.models import EventRecord, User
-        from app.repositories.event_record_repository import EventRecordRepository
-        from app.repositories.user_connection_repository import UserConnectionRepository
-        from app.repositories.user_repository import UserRepository
-        from app.services.providers.polar.oauth import PolarOAuth
-
         user_repo = UserRepository(User)
         connection_repo = UserConnectionRepository()
         workout_repo = EventRecordRepository(EventRecord)
@@ -256,15 +227,9 @@ class TestPolarWorkoutsMetricsBuilding:
 class TestPolarWorkoutsNormalization:
     """Tests for normalizing Polar exercises to event records."""
 
-    def test_normalize_workout_complete_data(self, db: Session, sample_polar_exercise: dict) -> None:
+    def test_normalize_workout_complete_data(self, db: Session, sample_polar_exercise: Mapping[str, Any]) -> None:
         """Test normalizing workout with complete data."""
         # Arrange
-        from app.models import EventRecord, User
-        from app.repositories.event_record_repository import EventRecordRepository
-        from app.repositories.user_connection_repository import UserConnectionRepository
-        from app.repositories.user_repository import UserRepository
-        from app.services.providers.polar.oauth import PolarOAuth
-
         user = UserFactory()
         user_repo = UserRepository(User)
         connection_repo = UserConnectionRepository()
@@ -302,12 +267,6 @@ class TestPolarWorkoutsNormalization:
     def test_normalize_workout_workout_type_mapping(self, db: Session) -> None:
         """Test workout type is correctly mapped from Polar sport type."""
         # Arrange
-        from app.models import EventRecord, User
-        from app.repositories.event_record_repository import EventRecordRepository
-        from app.repositories.user_connection_repository import UserConnectionRepository
-        from app.repositories.user_repository import UserRepository
-        from app.services.providers.polar.oauth import PolarOAuth
-
         user = UserFactory()
         user_repo = UserRepository(User)
         connection_repo = UserConnectionRepository()
@@ -351,12 +310,6 @@ class TestPolarWorkoutsAPIRequests:
     def test_get_workouts_from_api_default_params(self, mock_request: MagicMock, db: Session) -> None:
         """Test getting workouts with default parameters."""
         # Arrange
-        from app.models import EventRecord, User
-        from app.repositories.event_record_repository import EventRecordRepository
-        from app.repositories.user_connection_repository import UserConnectionRepository
-        from app.repositories.user_repository import UserRepository
-        from app.services.providers.polar.oauth import PolarOAuth
-
         user = UserFactory()
         UserConnectionFactory(user=user, provider="polar")
 
@@ -394,12 +347,6 @@ class TestPolarWorkoutsAPIRequests:
     def test_get_workouts_from_api_with_options(self, mock_request: MagicMock, db: Session) -> None:
         """Test getting workouts with samples, zones, and route enabled."""
         # Arrange
-        from app.models import EventRecord, User
-        from app.repositories.event_record_repository import EventRecordRepository
-        from app.repositories.user_connection_repository import UserConnectionRepository
-        from app.repositories.user_repository import UserRepository
-        from app.services.providers.polar.oauth import PolarOAuth
-
         user = UserFactory()
         UserConnectionFactory(user=user, provider="polar")
 
@@ -436,12 +383,6 @@ class TestPolarWorkoutsAPIRequests:
     def test_get_workout_detail_from_api(self, mock_request: MagicMock, db: Session) -> None:
         """Test getting detailed workout data for specific exercise."""
         # Arrange
-        from app.models import EventRecord, User
-        from app.repositories.event_record_repository import EventRecordRepository
-        from app.repositories.user_connection_repository import UserConnectionRepository
-        from app.repositories.user_repository import UserRepository
-        from app.services.providers.polar.oauth import PolarOAuth
-
         user = UserFactory()
         UserConnectionFactory(user=user, provider="polar")
 
@@ -487,16 +428,10 @@ class TestPolarWorkoutsDataLoading:
         mock_create: MagicMock,
         mock_request: MagicMock,
         db: Session,
-        sample_polar_exercise: dict,
+        sample_polar_exercise: Mapping[str, Any],
     ) -> None:
         """Test successful data loading from Polar API."""
         # Arrange
-        from app.models import EventRecord, User
-        from app.repositories.event_record_repository import EventRecordRepository
-        from app.repositories.user_connection_repository import UserConnectionRepository
-        from app.repositories.user_repository import UserRepository
-        from app.services.providers.polar.oauth import PolarOAuth
-
         user = UserFactory()
         UserConnectionFactory(user=user, provider="polar")
 
@@ -531,12 +466,6 @@ class TestPolarWorkoutsDataLoading:
     def test_load_data_empty_response(self, mock_request: MagicMock, db: Session) -> None:
         """Test loading data when API returns empty list."""
         # Arrange
-        from app.models import EventRecord, User
-        from app.repositories.event_record_repository import EventRecordRepository
-        from app.repositories.user_connection_repository import UserConnectionRepository
-        from app.repositories.user_repository import UserRepository
-        from app.services.providers.polar.oauth import PolarOAuth
-
         user = UserFactory()
         UserConnectionFactory(user=user, provider="polar")
 
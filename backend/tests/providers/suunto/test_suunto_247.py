@@ -0,0 +1,149 @@
+"""
+Tests for Suunto 247 data implementation.
+
+Tests cover:
+- Chunk parameters, chunk responses and subscription key headers
+- Daily activity statistics fetching
+- Sleep deduplication across chunk boundaries
+- Activity sample normalization
+"""
+
+from datetime import datetime, timedelta, timezone
+from typing import Any
+from unittest.mock import MagicMock, patch
+from uuid import uuid4
+
+import pytest
+
+from app.models import User
+from app.repositories.user_connection_repository import UserConnectionRepository
+from app.repositories.user_repository import UserRepository
+from app.services.providers.suunto.data_247 import Suunto247Data
+from app.services.providers.suunto.oauth import SuuntoOAuth
+
+
+@pytest.fixture(scope="module")
+def suunto_247() -> Suunto247Data:
+    """Create a Suunto247Data instance shared by every test in this module."""
+    oauth = SuuntoOAuth(
+        user_repo=UserRepository(User),
+        connection_repo=UserConnectionRepository(),
+        provider_name="suunto",
+        api_base_url="https://cloudapi.suunto.com",
+    )
+    return Suunto247Data(
+        provider_name="suunto",
+        api_base_url="https://cloudapi.suunto.com",
+        oauth=oauth,
+    )
+
+
+@pytest.mark.no_db
+class TestSuunto247Data:
+    """Tests for Suunto247Data class."""
+
+    def test_chunk_params(self, suunto_247: Suunto247Data) -> None:
+        """Test chunks are selected by time range in epoch milliseconds."""
+        start = datetime(2024, 1, 15, tzinfo=timezone.utc)
+        end = datetime(2024, 1, 16, tzinfo=timezone.utc)
+
+        params = suunto_247._chunk_params(start, end)
+
+        assert params == {"from": 1705276800000, "to": 1705363200000}
+
+    @pytest.mark.parametrize(
+        ("response", "expected"),
+        [
+            ([{"id": "1"}], [{"id": "1"}]),
+            ({"error": "Invalid range"}, []),
+            (None, []),
+        ],
+    )
+    def test_chunk_records_accepts_lists_only(
+        self, suunto_247: Suunto247Data, response: Any, expected: list[Any]
+    ) -> None:
+        """Test non-list responses (e.g. error bodies) carry no records."""
+        assert suunto_247._chunk_records(response) == expected
+
+    def test_make_token_request_sends_subscription_key(self, suunto_247: Suunto247Data) -> None:
+        """Test chunk requests carry the Suunto subscription key header."""
+        headers = {"Ocp-Apim-Subscription-Key": "sub-key"}
+
+        with (
+            patch.object(suunto_247, "_get_suunto_headers", return_value=headers),
+            patch("app.services.providers.suunto.data_247.make_token_request", return_value=[]) as mock_request,
+        ):
+            suunto_247._make_token_request("token", uuid4(), "/247samples/sleep", params={"from": 0, "to": 1})
+
+            assert mock_request.call_args.kwargs["headers"] == headers
+            assert mock_request.call_args.kwargs["access_token"] == "token"
+
+    def test_get_daily_activity_statistics_max_range_single_request(self, suunto_247: Suunto247Data) -> None:
+        """Test daily activity statistics within MAX_RANGE_DAYS are fetched in one request."""
+        end = datetime(2024, 1, 29, tzinfo=timezone.utc)
+        start = end - timedelta(days=Suunto247Data.MAX_RANGE_DAYS)
+
+        with patch.object(suunto_247, "_make_api_request", return_value=[{"date": "2024-01-15"}]) as mock_request:
+            result = suunto_247.get_daily_activity_statistics(MagicMock(), uuid4(), start, end)
+
+            mock_request.assert_called_once()
+            assert mock_request.call_args.kwargs["params"] == {
+                "startdate": "2024-01-02T00:00:00",
+                "enddate": "2024-01-29T00:00:00",
+            }
+            assert result == [{"date": "2024-01-15"}]
+
+    def test_load_and_save_sleep_skips_duplicate_sleeps(self, suunto_247: Suunto247Data) -> None:
+        """Test a sleep returned by two adjacent chunks is normalized and saved once."""
+        sleep = {"timestamp": "2024-01-28T22:00:00Z", "entryData": {"SleepId": 42, "Duration": 28800}}
+        other = {"timestamp": "2024-01-29T22:00:00Z", "entryData": {"SleepId": 43, "Duration": 27000}}
+        start = datetime(2024, 1, 1, tzinfo=timezone.utc)
+        end = start + timedelta(days=56)
+
+        with (
+            patch.object(suunto_247, "get_sleep_data", return_value=[sleep, sleep, other]),
+            patch.object(suunto_247, "normalize_sleep", wraps=suunto_247.normalize_sleep) as mock_normalize,
+            patch.object(suunto_247, "save_sleep_data") as mock_save,
+        ):
+            count = suunto_247.load_and_save_sleep(MagicMock(), uuid4(), start, end)
+
+            assert count == 2
+            assert mock_normalize.call_count == 2
+            assert mock_save.call_count == 2
+
+    def test_load_and_save_sleep_null_entry_data(self, suunto_247: Suunto247Data) -> None:
+        """Test sleeps with a null entryData are deduplicated by timestamp instead of failing."""
+        sleep = {"timestamp": "2024-01-28T22:00:00Z", "entryData": None}
+        start = datetime(2024, 1, 1, tzinfo=timezone.utc)
+        end = start + timedelta(days=56)
+
+        with (
+            patch.object(suunto_247, "get_sleep_data", return_value=[sleep, sleep]),
+            patch.object(suunto_247, "normalize_sleep", wraps=suunto_247.normalize_sleep) as mock_normalize,
+            patch.object(suunto_247, "save_sleep_data") as mock_save,
+        ):
+            count = suunto_247.load_and_save_sleep(MagicMock(), uuid4(), start, end)
+
+            assert count == 1
+            assert mock_normalize.call_count == 1
+            assert mock_save.call_count == 1
+
+    def test_normalize_activity_samples(self, suunto_247: Suunto247Data) -> None:
+        """Test activity samples are split by metric and empty entries are skipped."""
+        raw_samples = [
+            {
+                "timestamp": "2024-01-15T09:00:00Z",
+                "entryData": {"HR": 72, "StepCount": 120, "SpO2": 0.97, "EnergyConsumption": 4184, "HRV": 45},
+            },
+            {"timestamp": "2024-01-15T09:10:00Z", "entryData": {"HR": 75, "HRV": 0}},
+            {"timestamp": "2024-01-15T09:20:00Z"},
+        ]
+
+        normalized = suunto_247.normalize_activity_samples(raw_samples, uuid4())
+
+        assert [s["bpm"] for s in normalized["heart_rate"]] == [72, 75]
+        assert normalized["steps"] == [{"timestamp": "2024-01-15T09:00:00Z", "count": 120}]
+        assert normalized["spo2"][0]["percent"] == pytest.approx(97.0)
+        assert normalized["energy"][0]["joules"] == 4184.0
+        assert normalized["energy"][0]["kcal"] == 1.0
+        assert len(normalized["hrv"]) == 1
@@ -22,8 +22,9 @@ from sqlalchemy.orm import Session
 from app.models import User
 from app.repositories.user_connection_repository import UserConnectionRepository
 from app.repositories.user_repository import UserRepository
-from app.schemas.oauth import OAuthTokenResponse
+from app.schemas.oauth import AuthenticationMethod, OAuthTokenResponse
 from app.services.providers.suunto.oauth import SuuntoOAuth
+from tests.factories import UserConnectionFactory, UserFactory
 
 
 class TestSuuntoOAuth:
@@ -170,8 +171,6 @@ class TestSuuntoOAuth:
     def test_refresh_access_token_success(self, mock_post: MagicMock, suunto_oauth: SuuntoOAuth, db: Session) -> None:
         """Should refresh access token using refresh token."""
         # Arrange
-        from tests.factories import UserConnectionFactory, UserFactory
-
         user = UserFactory()
         UserConnectionFactory(
             user=user,
@@ -200,10 +199,7 @@ class TestSuuntoOAuth:
 
     def test_uses_basic_auth_method(self, suunto_oauth: SuuntoOAuth) -> None:
         """Should use Basic Auth for token exchange."""
-        # Act
-        from app.schemas.oauth import AuthenticationMethod
-
-        # Assert
+        # Act & Assert
         assert suunto_oauth.auth_method == AuthenticationMethod.BASIC_AUTH
 
     def test_does_not_use_pkce(self, suunto_oauth: SuuntoOAuth) -> None:
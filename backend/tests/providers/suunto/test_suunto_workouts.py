@@ -20,9 +20,10 @@ from uuid import uuid4
 import pytest
 from sqlalchemy.orm import Session
 
-from app.models import EventRecord
+from app.models import EventRecord, User
 from app.repositories.event_record_repository import EventRecordRepository
 from app.repositories.user_connection_repository import UserConnectionRepository
+from app.repositories.user_repository import UserRepository
 from app.schemas import SuuntoWorkoutJSON
 from app.schemas.suunto.workout_import import HeartRateJSON
 from app.schemas.workout_types import WorkoutType
@@ -39,7 +40,7 @@ class TestSuuntoWorkouts:
         workout_repo = EventRecordRepository(EventRecord)
         connection_repo = UserConnectionRepository()
         oauth = SuuntoOAuth(
-            user_repo=MagicMock(),
+            user_repo=UserRepository(User),
             connection_repo=connection_repo,
             provider_name="suunto",
             api_base_url="https://cloudapi.suunto.com",
@@ -4,15 +4,17 @@ Tests for base template classes.
 Tests cover:
 - BaseOAuthTemplate abstract interface
 - BaseWorkoutsTemplate abstract interface
+- Base247DataTemplate chunked fetching and bulk saving
 - Template method pattern implementation
 - Abstract method enforcement
 - Repository integration
 """
 
 from abc import ABC
-from datetime import datetime, timezone
+from datetime import datetime, timedelta, timezone
 from typing import Any
-from unittest.mock import MagicMock
+from unittest.mock import MagicMock, patch
+from uuid import UUID, uuid4
 
 import pytest
 
@@ -20,6 +22,7 @@ from app.repositories.event_record_repository import EventRecordRepository
 from app.repositories.user_connection_repository import UserConnectionRepository
 from app.repositories.user_repository import UserRepository
 from app.schemas import EventRecordCreate, EventRecordDetailCreate
+from app.services.providers.templates.base_247_data import Base247DataTemplate
 from app.services.providers.templates.base_oauth import BaseOAuthTemplate
 from app.services.providers.templates.base_workouts import BaseWorkoutsTemplate
 
@@ -134,3 +137,197 @@ class TestBaseWorkoutsTemplate:
         # Assert
         assert result_start == start
         assert result_end == end
+
+
+class Chunked247Data(Base247DataTemplate):
+    """Minimal 247 data provider selecting chunks by epoch seconds."""
+
+    def _chunk_params(self, chunk_start: datetime, chunk_end: datetime) -> dict[str, Any]:
+        return {"start": int(chunk_start.timestamp()), "end": int(chunk_end.timestamp())}
+
+    def get_sleep_data(self, db: Any, user_id: UUID, start_time: datetime, end_time: datetime) -> list:
+        return []
+
+    def normalize_sleep(self, raw_sleep: dict[str, Any], user_id: UUID) -> dict[str, Any]:
+        return raw_sleep
+
+    def get_recovery_data(self, db: Any, user_id: UUID, start_time: datetime, end_time: datetime) -> list:
+        return []
+
+    def normalize_recovery(self, raw_recovery: dict[str, Any], user_id: UUID) -> dict[str, Any]:
+        return raw_recovery
+
+    def get_activity_samples(self, db: Any, user_id: UUID, start_time: datetime, end_time: datetime) -> list:
+        return []
+
+    def normalize_activity_samples(self, raw_samples: list[dict[str, Any]], user_id: UUID) -> dict[str, list]:
+        return {}
+
+    def get_daily_activity_statistics(self, db: Any, user_id: UUID, start_date: datetime, end_date: datetime) -> list:
+        return []
+
+    def normalize_daily_activity(self, raw_stats: dict[str, Any], user_id: UUID) -> dict[str, Any]:
+        return raw_stats
+
+
+@pytest.fixture
+def chunked_247() -> Chunked247Data:
+    """Create a minimal 247 data provider with 1-day chunks."""
+    return Chunked247Data(provider_name="test", api_base_url="https://api.test.com", oauth=MagicMock())
+
+
+@pytest.mark.no_db
+class TestBase247DataTemplate:
+    """Test suite for Base247DataTemplate chunked fetching and bulk saving."""
+
+    def test_fetch_in_chunks_single_chunk(self, chunked_247: Chunked247Data) -> None:
+        """Should make one request for a range shorter than CHUNK_SIZE."""
+        # Arrange
+        start = datetime(2024, 1, 15, 0, 0, 0, tzinfo=timezone.utc)
+        end = datetime(2024, 1, 15, 12, 0, 0, tzinfo=timezone.utc)
+
+        # Act
+        with (
+            patch.object(chunked_247, "_get_access_token", return_value="token"),
+            patch.object(chunked_247, "_make_token_request", return_value=[{"id": "1"}]) as mock_request,
+        ):
+            result = chunked_247._fetch_in_chunks(MagicMock(), uuid4(), "/test", start, end)
+
+        # Assert
+        assert mock_request.call_count == 1
+        assert result == [{"id": "1"}]
+
+    def test_fetch_in_chunks_custom_chunk_size(self, chunked_247: Chunked247Data) -> None:
+        """Should split the range by an explicit chunk size instead of CHUNK_SIZE."""
+        # Arrange
+        start = datetime(2024, 1, 1, tzinfo=timezone.utc)
+        end = datetime(2024, 1, 2, tzinfo=timezone.utc)
+
+        # Act
+        with (
+            patch.object(chunked_247, "_get_access_token", return_value="token"),
+            patch.object(chunked_247, "_make_token_request", return_value=[{"id": "1"}]) as mock_request,
+        ):
+            result = chunked_247._fetch_in_chunks(
+                MagicMock(), uuid4(), "/test", start, end, chunk_size=timedelta(hours=6)
+            )
+
+        # Assert
+        assert mock_request.call_count == 4
+        assert len(result) == 4
+
+    def test_fetch_in_chunks_token_resolved_once_in_order(self, chunked_247: Chunked247Data) -> None:
+        """Should resolve the token once and keep chronological order across concurrent chunks."""
+        # Arrange
+        db = MagicMock()
+        user_id = uuid4()
+        start = datetime(2024, 1, 1, tzinfo=timezone.utc)
+        end = datetime(2024, 1, 6, tzinfo=timezone.utc)  # 5 days
+
+        def fake_request(access_token: str, user_id: UUID, endpoint: str, params: dict[str, int]) -> list[Any]:
+            return [{"start": params["start"], "token": access_token}]
+
+        # Act
+        with (
+            patch.object(chunked_247, "_get_access_token", return_value="token") as mock_token,
+            patch.object(chunked_247, "_make_token_request", side_effect=fake_request) as mock_request,
+        ):
+            result = chunked_247._fetch_in_chunks(db, user_id, "/test", start, end)
+
+        # Assert
+        mock_token.assert_called_once_with(db, user_id)
+        assert mock_request.call_count == 5
+        starts = [record["start"] for record in result]
+        assert starts == sorted(starts)
+        assert len(starts) == 5
+        assert {record["token"] for record in result} == {"token"}
+
+    def test_fetch_in_chunks_continues_after_chunk_error(self, chunked_247: Chunked247Data) -> None:
+        """Should keep records from chunks that succeed when another chunk fails."""
+        # Arrange
+        start = datetime(2024, 1, 1, tzinfo=timezone.utc)
+        end = datetime(2024, 1, 3, tzinfo=timezone.utc)
+
+        # Act
+        with (
+            patch.object(chunked_247, "_get_access_token", return_value="token"),
+            patch.object(
+                chunked_247,
+                "_make_token_request",
+                side_effect=[Exception("API Error"), [{"id": "2"}]],
+            ) as mock_request,
+        ):
+            result = chunked_247._fetch_in_chunks(MagicMock(), uuid4(), "/test", start, end)
+
+        # Assert
+        assert mock_request.call_count == 2
+        assert result == [{"id": "2"}]
+
+    def test_fetch_in_chunks_token_error(self, chunked_247: Chunked247Data) -> None:
+        """Should request no chunk when the access token cannot be resolved."""
+        # Arrange
+        start = datetime(2024, 1, 1, tzinfo=timezone.utc)
+        end = datetime(2024, 1, 3, tzinfo=timezone.utc)
+
+        # Act
+        with (
+            patch.object(chunked_247, "_get_access_token", side_effect=Exception("Not connected")),
+            patch.object(chunked_247, "_make_token_request") as mock_request,
+        ):
+            result = chunked_247._fetch_in_chunks(MagicMock(), uuid4(), "/test", start, end)
+
+        # Assert
+        assert result == []
+        mock_request.assert_not_called()
+
+    @pytest.mark.parametrize(
+        ("response", "expected"),
+        [
+            ([{"id": "1"}, {"id": "2"}], [{"id": "1"}, {"id": "2"}]),
+            ({"id": "1"}, [{"id": "1"}]),
+            (None, []),
+            ({}, []),
+        ],
+    )
+    def test_chunk_records_default(self, chunked_247: Chunked247Data, response: Any, expected: list) -> None:
+        """Should pass lists through, wrap a single record and drop empty responses."""
+        # Act & Assert
+        assert chunked_247._chunk_records(response) == expected
+
+    def test_chunk_params_required_for_chunked_fetching(self) -> None:
+        """Should refuse chunked fetching for providers without _chunk_params."""
+        # Arrange
+        start = datetime(2024, 1, 1, tzinfo=timezone.utc)
+
+        # Act & Assert
+        with pytest.raises(NotImplementedError):
+            Base247DataTemplate._chunk_params(MagicMock(), start, start + timedelta(days=1))
+
+    def test_bulk_save_samples(self, chunked_247: Chunked247Data) -> None:
+        """Should insert samples with one bulk call and commit once."""
+        # Arrange
+        db = MagicMock()
+        samples = [MagicMock(), MagicMock()]
+        chunked_247.data_point_repo = MagicMock()
+
+        # Act
+        count = chunked_247._bulk_save_samples(db, samples)
+
+        # Assert
+        assert count == 2
+        chunked_247.data_point_repo.bulk_create.assert_called_once_with(db, samples)
+        db.commit.assert_called_once()
+
+    def test_bulk_save_samples_empty(self, chunked_247: Chunked247Data) -> None:
+        """Should skip the database entirely when there is nothing to save."""
+        # Arrange
+        db = MagicMock()
+        chunked_247.data_point_repo = MagicMock()
+
+        # Act
+        count = chunked_247._bulk_save_samples(db, [])
+
+        # Assert
+        assert count == 0
+        chunked_247.data_point_repo.bulk_create.assert_not_called()
+        db.commit.assert_not_called()
@@ -0,0 +1,252 @@
+"""
+Tests for the provider API client.
+
+Tests cover:
+- Access token lookup from the user connection
+- Caching of valid access tokens on the OAuth instance
+- Eviction of cached tokens close to expiry
+- Caching of refreshed tokens
+- Bounded cache age and size, and eviction of rejected or replaced tokens
+- Shared pooled HTTP client
+"""
+
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
+from unittest.mock import MagicMock, patch
+from uuid import UUID
+
+import httpx
+import pytest
+from fastapi import HTTPException
+from sqlalchemy.orm import Session
+
+from app.models import User
+from app.repositories.user_connection_repository import UserConnectionRepository
+from app.repositories.user_repository import UserRepository
+from app.schemas.oauth import OAuthState, OAuthTokenResponse
+from app.services.providers.api_client import get_http_client, get_valid_token, make_authenticated_request
+from app.services.providers.suunto.oauth import SuuntoOAuth
+from app.services.providers.templates import base_oauth
+from app.services.providers.templates.base_oauth import TOKEN_CACHE_MAX_AGE
+from tests.factories import UserConnectionFactory, UserFactory
+
+
+class TestGetValidToken:
+    """Test suite for get_valid_token."""
+
+    @pytest.fixture
+    def suunto_oauth(self) -> SuuntoOAuth:
+        """Create SuuntoOAuth instance for testing."""
+        return SuuntoOAuth(
+            user_repo=UserRepository(User),
+            connection_repo=UserConnectionRepository(),
+            provider_name="suunto",
+            api_base_url="https://cloudapi.suunto.com",
+        )
+
+    def test_caches_valid_token(self, db: Session, suunto_oauth: SuuntoOAuth) -> None:
+        """Should reuse the cached token without querying the connection again."""
+        # Arrange
+        user = UserFactory()
+        UserConnectionFactory(
+            user=user,
+            provider="suunto",
+            access_token="valid_token",
+            token_expires_at=datetime.now(timezone.utc) + timedelta(hours=1),
+        )
+        connection_repo = UserConnectionRepository()
+
+        # Act
+        first = get_valid_token(db, user.id, "suunto", connection_repo, suunto_oauth)
+        with patch.object(connection_repo, "get_by_user_and_provider") as mock_get:
+            second = get_valid_token(db, user.id, "suunto", connection_repo, suunto_oauth)
+
+        # Assert
+        assert first == second == "valid_token"
+        mock_get.assert_not_called()
+
+    def test_evicts_expiring_cached_token(self, suunto_oauth: SuuntoOAuth) -> None:
+        """Should drop a cached token that is about to expire."""
+        # Arrange
+        user_id = UserFactory.build().id
+        suunto_oauth.cache_access_token(user_id, "stale_token", datetime.now(timezone.utc) + timedelta(minutes=1))
+
+        # Act & Assert
+        assert suunto_oauth.get_cached_access_token(user_id) is None
+        assert user_id not in suunto_oauth._token_cache
+
+    def test_cached_token_expires_over_time(self, suunto_oauth: SuuntoOAuth) -> None:
+        """Should drop a cached token once its refresh deadline has passed."""
+        # Arrange
+        user_id = UserFactory.build().id
+        suunto_oauth.cache_access_token(user_id, "valid_token", datetime.now(timezone.utc) + timedelta(hours=1))
+        later = time.monotonic() + timedelta(hours=1).total_seconds()
+
+        # Act & Assert
+        assert suunto_oauth.get_cached_access_token(user_id) == "valid_token"
+        with patch("time.monotonic", return_value=later):
+            assert suunto_oauth.get_cached_access_token(user_id) is None
+
+    def test_token_without_expiry_is_cached_for_max_age(self, suunto_oauth: SuuntoOAuth) -> None:
+        """Should re-read tokens without an expiry once the maximum cache age has passed."""
+        # Arrange
+        user_id = UserFactory.build().id
+        suunto_oauth.cache_access_token(user_id, "valid_token", None)
+        later = time.monotonic() + TOKEN_CACHE_MAX_AGE.total_seconds()
+
+        # Act & Assert
+        assert suunto_oauth.get_cached_access_token(user_id) == "valid_token"
+        with patch("time.monotonic", return_value=later):
+            assert suunto_oauth.get_cached_access_token(user_id) is None
+
+    def test_cache_drops_least_recently_used_token(self, suunto_oauth: SuuntoOAuth) -> None:
+        """Should keep at most TOKEN_CACHE_MAX_SIZE tokens, dropping the least recently used."""
+        # Arrange
+        first, second, third = (UserFactory.build().id for _ in range(3))
+
+        # Act
+        with patch.object(base_oauth, "TOKEN_CACHE_MAX_SIZE", 2):
+            suunto_oauth.cache_access_token(first, "first_token", None)
+            suunto_oauth.cache_access_token(second, "second_token", None)
+            suunto_oauth.get_cached_access_token(first)
+            suunto_oauth.cache_access_token(third, "third_token", None)
+
+        # Assert
+        assert suunto_oauth.get_cached_access_token(first) == "first_token"
+        assert suunto_oauth.get_cached_access_token(second) is None
+        assert suunto_oauth.get_cached_access_token(third) == "third_token"
+
+    def test_cache_is_consistent_under_concurrent_use(self, suunto_oauth: SuuntoOAuth) -> None:
+        """Should stay bounded when the shared OAuth instance is used from many threads."""
+        # Arrange
+        user_ids = [UserFactory.build().id for _ in range(200)]
+
+        def use_cache(user_id: UUID) -> None:
+            suunto_oauth.cache_access_token(user_id, "token", None)
+            suunto_oauth.get_cached_access_token(user_id)
+            suunto_oauth.evict_access_token(user_ids[0])
+
+        # Act
+        with patch.object(base_oauth, "TOKEN_CACHE_MAX_SIZE", 50), ThreadPoolExecutor(max_workers=8) as executor:
+            list(executor.map(use_cache, user_ids))
+
+        # Assert
+        assert len(suunto_oauth._token_cache) <= 50
+
+    def test_save_connection_evicts_cached_token(self, suunto_oauth: SuuntoOAuth) -> None:
+        """Should drop the cached token when a re-authorization saves new tokens."""
+        # Arrange
+        user_id = UserFactory.build().id
+        suunto_oauth.cache_access_token(user_id, "old_token", None)
+        token_response = OAuthTokenResponse(access_token="new_token", token_type="Bearer", expires_in=3600)
+
+        # Act
+        with patch.object(suunto_oauth.connection_repo, "upsert"):
+            suunto_oauth._save_connection(
+                MagicMock(),
+                user_id,
+                token_response,
+                {"user_id": None, "username": None},
+                OAuthState(user_id=user_id, provider="suunto"),
+            )
+
+        # Assert
+        assert suunto_oauth.get_cached_access_token(user_id) is None
+
+    @patch("httpx.post")
+    def test_refresh_caches_new_token(self, mock_post: MagicMock, db: Session, suunto_oauth: SuuntoOAuth) -> None:
+        """Should cache the refreshed token for subsequent requests."""
+        # Arrange
+        user = UserFactory()
+        UserConnectionFactory(
+            user=user,
+            provider="suunto",
+            refresh_token="old_refresh_token",
+            token_expires_at=datetime.now(timezone.utc) - timedelta(hours=1),
+        )
+        mock_response = MagicMock()
+        mock_response.json.return_value = {
+            "access_token": "new_access_token",
+            "refresh_token": "new_refresh_token",
+            "expires_in": 3600,
+            "token_type": "Bearer",
+        }
+        mock_response.raise_for_status.return_value = None
+        mock_post.return_value = mock_response
+
+        # Act
+        token = get_valid_token(db, user.id, "suunto", UserConnectionRepository(), suunto_oauth)
+
+        # Assert
+        assert token == "new_access_token"
+        assert suunto_oauth.get_cached_access_token(user.id) == "new_access_token"
+        mock_post.assert_called_once()
+
+
+class TestMakeAuthenticatedRequest:
+    """Test suite for make_authenticated_request."""
+
+    def test_http_client_is_shared(self) -> None:
+        """Should return the same pooled client on every call."""
+        # Act & Assert
+        assert get_http_client() is get_http_client()
+
+    def test_uses_shared_http_client(self) -> None:
+        """Should send requests through the shared client."""
+        # Arrange
+        oauth = MagicMock()
+        oauth.get_cached_access_token.return_value = "cached_token"
+        request = httpx.Request("GET", "https://api.example.com/v1/data")
+        response = httpx.Response(200, request=request, json={"data": []})
+
+        # Act
+        with patch.object(get_http_client(), "request", return_value=response) as mock_request:
+            result = make_authenticated_request(
+                db=MagicMock(),
+                user_id=UserFactory.build().id,
+                connection_repo=MagicMock(),
+                oauth=oauth,
+                api_base_url="https://api.example.com",
+                provider_name="suunto",
+                endpoint="/v1/data",
+            )
+
+        # Assert
+        assert result == {"data": []}
+        mock_request.assert_called_once()
+        assert mock_request.call_args.kwargs["url"] == "https://api.example.com/v1/data"
+        assert mock_request.call_args.kwargs["headers"]["Authorization"] == "Bearer cached_token"
+
+    def test_unauthorized_response_evicts_cached_token(self) -> None:
+        """Should stop serving a cached token once the provider rejects it."""
+        # Arrange
+        oauth = SuuntoOAuth(
+            user_repo=UserRepository(User),
+            connection_repo=UserConnectionRepository(),
+            provider_name="suunto",
+            api_base_url="https://cloudapi.suunto.com",
+        )
+        user_id = UserFactory.build().id
+        oauth.cache_access_token(user_id, "revoked_token", None)
+        request = httpx.Request("GET", "https://cloudapi.suunto.com/v2/workouts")
+        unauthorized = httpx.Response(401, request=request, text="Unauthorized")
+
+        # Act
+        with (
+            patch.object(get_http_client(), "request", return_value=unauthorized),
+            pytest.raises(HTTPException) as exc_info,
+        ):
+            make_authenticated_request(
+                db=MagicMock(),
+                user_id=user_id,
+                connection_repo=MagicMock(),
+                oauth=oauth,
+                api_base_url="https://cloudapi.suunto.com",
+                provider_name="suunto",
+                endpoint="/v2/workouts",
+            )
+
+        # Assert
+        assert exc_info.value.status_code == 401
+        assert oauth.get_cached_access_token(user_id) is None
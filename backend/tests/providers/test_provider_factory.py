@@ -153,15 +153,15 @@ class TestProviderFactory:
         assert strategy.oauth is not None
         assert strategy.has_cloud_api is True
 
-    def test_multiple_calls_create_new_instances(
+    def test_multiple_calls_reuse_instance(
         self,
         factory: ProviderFactory,
     ) -> None:
-        """Should create new instances on each call (not singleton)."""
+        """Should reuse one instance per provider, also across factories."""
         # Act
         strategy1 = factory.get_provider("garmin")
-        strategy2 = factory.get_provider("garmin")
+        strategy2 = ProviderFactory().get_provider("garmin")
 
         # Assert
-        assert strategy1 is not strategy2
-        assert strategy1.name == strategy2.name
+        assert strategy1 is strategy2
+        assert factory.get_provider("polar") is not strategy1
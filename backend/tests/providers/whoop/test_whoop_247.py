@@ -0,0 +1,125 @@
+"""Tests for Whoop 247 data implementation."""
+
+from typing import Any
+from unittest.mock import MagicMock, patch
+from uuid import uuid4
+
+import pytest
+from sqlalchemy.orm import Session
+
+from app.models import EventRecord, SleepDetails, User
+from app.repositories.user_connection_repository import UserConnectionRepository
+from app.repositories.user_repository import UserRepository
+from app.services.providers.whoop.data_247 import Whoop247Data
+from app.services.providers.whoop.oauth import WhoopOAuth
+from tests.factories import UserFactory
+
+
+class TestWhoop247Data:
+    """Tests for Whoop247Data class."""
+
+    @pytest.fixture
+    def whoop_247(self) -> Whoop247Data:
+        """Create Whoop247Data instance for testing."""
+        oauth = WhoopOAuth(
+            user_repo=UserRepository(User),
+            connection_repo=UserConnectionRepository(),
+            provider_name="whoop",
+            api_base_url="https://api.prod.whoop.com/developer",
+        )
+        return Whoop247Data(
+            provider_name="whoop",
+            api_base_url="https://api.prod.whoop.com/developer",
+            oauth=oauth,
+        )
+
+    @staticmethod
+    def _raw_sleep(day: int, efficiency: float = 91.5) -> dict[str, Any]:
+        """Build a raw Whoop v2 sleep payload for 2024-01-<day>."""
+        return {
+            "id": str(uuid4()),
+            "cycle_id": 1000 + day,
+            "start": f"2024-01-{day:02d}T22:00:00.000Z",
+            "end": f"2024-01-{day + 1:02d}T06:00:00.000Z",
+            "nap": False,
+            "score_state": "SCORED",
+            "score": {
+                "stage_summary": {
+                    "total_in_bed_time_milli": 28_800_000,
+                    "total_awake_time_milli": 1_800_000,
+                    "total_light_sleep_time_milli": 14_400_000,
+                    "total_slow_wave_sleep_time_milli": 7_200_000,
+                    "total_rem_sleep_time_milli": 5_400_000,
+                },
+                "sleep_efficiency_percentage": efficiency,
+            },
+        }
+
+    # -------------------------------------------------------------------------
+    # Sleep Tests
+    # -------------------------------------------------------------------------
+
+    def test_save_sleep_data_batch(self, whoop_247: Whoop247Data, db: Session) -> None:
+        """Test that a batch of sleeps is saved with details."""
+        user = UserFactory()
+        normalized = [whoop_247.normalize_sleep(self._raw_sleep(day), user.id) for day in (14, 15, 16)]
+
+        whoop_247.save_sleep_data_batch(db, user.id, normalized)
+
+        for sleep in normalized:
+            record = db.query(EventRecord).filter(EventRecord.id == sleep["id"]).one()
+            assert record.category == "sleep"
+            detail = db.query(SleepDetails).filter(SleepDetails.record_id == sleep["id"]).one()
+            assert detail.sleep_deep_minutes == 120
+
+    def test_save_sleep_data_batch_skips_existing(self, whoop_247: Whoop247Data, db: Session) -> None:
+        """Test that re-syncing an existing sleep does not duplicate it."""
+        user = UserFactory()
+        normalized = whoop_247.normalize_sleep(self._raw_sleep(15), user.id)
+
+        whoop_247.save_sleep_data_batch(db, user.id, [normalized])
+        whoop_247.save_sleep_data_batch(db, user.id, [normalized])
+
+        assert db.query(EventRecord).filter(EventRecord.id == normalized["id"]).count() == 1
+        assert db.query(SleepDetails).filter(SleepDetails.record_id == normalized["id"]).count() == 1
+
+    def test_save_sleep_data_batch_falls_back_on_error(self, whoop_247: Whoop247Data, db: Session) -> None:
+        """Test that sleeps are saved individually when the batch insert fails."""
+        user_id = uuid4()
+        normalized = [whoop_247.normalize_sleep(self._raw_sleep(day), user_id) for day in (14, 15)]
+
+        with (
+            patch("app.services.providers.whoop.data_247.event_record_service") as mock_service,
+            patch.object(whoop_247, "_save_sleep_record") as mock_save_record,
+        ):
+            mock_service.bulk_create.side_effect = Exception("boom")
+            whoop_247.save_sleep_data_batch(db, user_id, normalized)
+
+        assert mock_save_record.call_count == 2
+
+    def test_save_sleep_data_batch_skips_missing_times(self, whoop_247: Whoop247Data, db: Session) -> None:
+        """Test that sleeps without start/end times are skipped."""
+        user = UserFactory()
+        raw = self._raw_sleep(15)
+        raw["start"] = None
+        normalized = whoop_247.normalize_sleep(raw, user.id)
+
+        with patch("app.services.providers.whoop.data_247.event_record_service") as mock_service:
+            whoop_247.save_sleep_data_batch(db, user.id, [normalized])
+
+        mock_service.bulk_create.assert_not_called()
+
+    def test_load_and_save_sleep(self, whoop_247: Whoop247Data, db: Session) -> None:
+        """Test that loaded sleeps are saved in a single batch."""
+        user_id = uuid4()
+        raw_sleeps = [self._raw_sleep(day) for day in (14, 15)]
+
+        with (
+            patch.object(whoop_247, "get_sleep_data", return_value=raw_sleeps),
+            patch.object(whoop_247, "save_sleep_data_batch") as mock_save_batch,
+        ):
+            count = whoop_247.load_and_save_sleep(db, user_id, MagicMock(), MagicMock())
+
+        assert count == 2
+        mock_save_batch.assert_called_once()
+        assert len(mock_save_batch.call_args.args[2]) == 2
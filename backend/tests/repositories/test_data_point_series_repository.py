@@ -3,6 +3,7 @@ Tests for DataPointSeriesRepository.
 
 Tests cover:
 - CRUD operations with data source integration
+- Batched bulk inserts
 - get_samples with filtering by series type, device, date range
 - Aggregation methods (get_total_count, get_count_in_range, get_daily_histogram)
 - get_count_by_series_type and get_count_by_provider
@@ -10,9 +11,11 @@ Tests cover:
 
 from datetime import datetime, timedelta, timezone
 from decimal import Decimal
+from unittest.mock import patch
 from uuid import uuid4
 
 import pytest
+from sqlalchemy import text
 from sqlalchemy.orm import Session
 
 from app.models import DataPointSeries, DataSource
@@ -167,6 +170,89 @@ class TestDataPointSeriesRepository:
         assert result2.data_source_id == mapping.id
         assert result2.recorded_at == recorded_time
 
+    def test_bulk_create_splits_into_batches(self, db: Session, series_repo: DataPointSeriesRepository) -> None:
+        """Test that bulk_create inserts every sample when rows span multiple batches."""
+        # Arrange
+        user = UserFactory()
+        now = datetime.now(timezone.utc)
+        samples = [
+            TimeSeriesSampleCreate(
+                id=uuid4(),
+                user_id=user.id,
+                source="garmin",
+                recorded_at=now + timedelta(seconds=i),
+                value=60 + i,
+                series_type=SeriesType.heart_rate,
+            )
+            for i in range(5)
+        ]
+
+        # Act
+        with patch("app.repositories.data_point_series_repository.BULK_INSERT_BATCH_SIZE", 2):
+            series_repo.bulk_create(db, samples)
+        db.commit()
+
+        # Assert
+        for sample in samples:
+            assert series_repo.get(db, sample.id) is not None
+
+    def test_bulk_create_copies_large_batches(self, db: Session, series_repo: DataPointSeriesRepository) -> None:
+        """Test that bulk_create loads large batches with COPY and skips duplicates."""
+        # Arrange
+        user = UserFactory()
+        now = datetime.now(timezone.utc)
+        samples = [
+            TimeSeriesSampleCreate(
+                id=uuid4(),
+                user_id=user.id,
+                source="garmin",
+                recorded_at=now + timedelta(seconds=i),
+                value=60 + i,
+                series_type=SeriesType.heart_rate,
+            )
+            for i in range(3)
+        ]
+        duplicate = samples[0].model_copy(update={"id": uuid4()})
+
+        # Act
+        with patch("app.repositories.data_point_series_repository.COPY_THRESHOLD", 1):
+            series_repo.bulk_create(db, samples)
+            series_repo.bulk_create(db, [duplicate])
+        db.commit()
+
+        # Assert
+        for sample in samples:
+            assert series_repo.get(db, sample.id) is not None
+        assert series_repo.get(db, duplicate.id) is None
+
+    def test_bulk_create_copy_reuses_leftover_staging_table(
+        self, db: Session, series_repo: DataPointSeriesRepository
+    ) -> None:
+        """Test that a staging table left behind earlier in the transaction does not break COPY."""
+        # Arrange
+        user = UserFactory()
+        db.execute(
+            text(
+                "CREATE TEMP TABLE data_point_series_staging (LIKE data_point_series INCLUDING DEFAULTS) ON COMMIT DROP"
+            )
+        )
+        sample = TimeSeriesSampleCreate(
+            id=uuid4(),
+            user_id=user.id,
+            source="garmin",
+            recorded_at=datetime.now(timezone.utc),
+            value=60,
+            series_type=SeriesType.heart_rate,
+        )
+
+        # Act
+        with patch("app.repositories.data_point_series_repository.COPY_THRESHOLD", 1):
+            series_repo.bulk_create(db, [sample])
+        db.commit()
+
+        # Assert
+        assert series_repo.get(db, sample.id) is not None
+
     def test_get_samples_requires_device_filter(self, db: Session, series_repo: DataPointSeriesRepository) -> None:
         """Test that get_samples requires at least device_id or data_source_id."""
         # Arrange
@@ -224,8 +310,7 @@ class TestDataPointSeriesRepository:
         # Assert
         assert len(results) == 3
         assert total_count == 3
-        for _, data_source in results:
-            assert data_source.device_model == "device1"
+        assert {data_source.device_model for _, data_source in results} == {"device1"}
 
     def test_get_samples_by_data_source_id(self, db: Session, series_repo: DataPointSeriesRepository) -> None:
         """Test getting samples filtered by external mapping ID."""
@@ -258,8 +343,7 @@ class TestDataPointSeriesRepository:
         # Assert
         assert len(results) == 3
         assert total_count == 3
-        for sample, _ in results:
-            assert sample.data_source_id == mapping.id
+        assert {sample.data_source_id for sample, _ in results} == {mapping.id}
 
     def test_get_samples_by_series_type(self, db: Session, series_repo: DataPointSeriesRepository) -> None:
         """Test that get_samples only returns samples of the specified series type."""
@@ -306,8 +390,7 @@ class TestDataPointSeriesRepository:
         from app.schemas.series_types import get_series_type_id
 
         expected_type_id = get_series_type_id(SeriesType.heart_rate)
-        for sample, _ in results:
-            assert sample.series_type_definition_id == expected_type_id
+        assert {sample.series_type_definition_id for sample, _ in results} == {expected_type_id}
 
     def test_get_samples_by_date_range(self, db: Session, series_repo: DataPointSeriesRepository) -> None:
         """Test filtering samples by date range.
@@ -686,5 +769,4 @@ class TestDataPointSeriesRepository:
         # Assert
         assert len(results) == 2
         assert total_count == 2
-        for _, data_source in results:
-            assert data_source.user_id == user1.id
+        assert {data_source.user_id for _, data_source in results} == {user1.id}
@@ -102,6 +102,30 @@ class TestEventRecordRepository:
         assert data_source.source == "garmin"
         assert data_source.device_model == "device456"
 
+    def test_create_duplicate_returns_existing(self, db: Session, event_repo: EventRecordRepository) -> None:
+        """Test that creating a record with the same source and times returns the existing one."""
+        # Arrange
+        user = UserFactory()
+        mapping = DataSourceFactory(user=user, source="garmin")
+        now = datetime.now(timezone.utc)
+        event_data = EventRecordCreate(
+            id=uuid4(),
+            user_id=user.id,
+            source="garmin",
+            data_source_id=mapping.id,
+            category="sleep",
+            source_name="Garmin",
+            start_datetime=now,
+            end_datetime=now + timedelta(hours=8),
+        )
+        first = event_repo.create(db, event_data)
+
+        # Act
+        second = event_repo.create(db, event_data.model_copy(update={"id": uuid4()}))
+
+        # Assert
+        assert second.id == first.id
+
     def test_get(self, db: Session, event_repo: EventRecordRepository) -> None:
         """Test retrieving an event record by ID."""
         # Arrange
@@ -138,8 +162,7 @@ class TestEventRecordRepository:
         # Assert
         assert total_count == 2
         assert len(results) == 2
-        for event, _ in results:
-            assert event.category == "workout"
+        assert {event.category for event, _ in results} == {"workout"}
 
     def test_get_records_with_filters_by_type(self, db: Session, event_repo: EventRecordRepository) -> None:
         """Test filtering event records by type (with ILIKE)."""
@@ -190,8 +213,7 @@ class TestEventRecordRepository:
 
         # Assert
         assert total_count == 2
-        for _, data_source in results:
-            assert data_source.device_model == "device1"
+        assert {data_source.device_model for _, data_source in results} == {"device1"}
 
     def test_get_records_with_filters_by_provider(self, db: Session, event_repo: EventRecordRepository) -> None:
         """Test filtering event records by provider ID."""
@@ -461,8 +483,7 @@ class TestEventRecordRepository:
 
         # Assert
         assert total_count == 2
-        for _, mapping in results:
-            assert mapping.user_id == user1.id
+        assert {mapping.user_id for _, mapping in results} == {user1.id}
 
     def test_delete(self, db: Session, event_repo: EventRecordRepository) -> None:
         """Test deleting an event record."""
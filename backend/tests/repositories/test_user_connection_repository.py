@@ -4,7 +4,7 @@ Tests for UserConnectionRepository.
 Tests cover:
 - CRUD operations (create, get, get_all, update, delete)
 - Specialized query methods (get_by_user_and_provider, get_active_connection, etc.)
-- Token management (update_tokens, mark_as_revoked)
+- Token management (update_tokens, mark_as_revoked, upsert)
 - Status filtering and counting (get_active_count, get_active_count_in_range)
 - Token expiration queries (get_expiring_tokens)
 """
@@ -354,6 +354,56 @@ class TestUserConnectionRepository:
         assert result.access_token == "new_access"
         assert result.refresh_token == "original_refresh"  # Unchanged
 
+    def test_upsert_creates_connection(self, db: Session, connection_repo: UserConnectionRepository) -> None:
+        """Test upsert inserts a new connection when none exists."""
+        # Arrange
+        user = UserFactory()
+        connection_data = UserConnectionCreate(
+            user_id=user.id,
+            provider="polar",
+            provider_user_id="polar_123",
+            access_token="access_token_xyz",
+            refresh_token="refresh_token_abc",
+            token_expires_at=datetime.now(timezone.utc) + timedelta(hours=1),
+        )
+
+        # Act
+        result = connection_repo.upsert(db, connection_data)
+
+        # Assert
+        assert result.id == connection_data.id
+        assert result.provider_user_id == "polar_123"
+        assert connection_repo.get_by_user_and_provider(db, user.id, "polar") is result
+
+    def test_upsert_updates_existing_connection(self, db: Session, connection_repo: UserConnectionRepository) -> None:
+        """Test upsert updates tokens and keeps existing values that are not provided."""
+        # Arrange
+        connection = UserConnectionFactory(
+            provider="polar",
+            provider_user_id="polar_original",
+            access_token="old_access",
+            refresh_token="original_refresh",
+            scope="read_all",
+        )
+        connection_data = UserConnectionCreate(
+            user_id=connection.user_id,
+            provider="polar",
+            provider_user_id="polar_new",
+            access_token="new_access",
+            refresh_token=None,
+            token_expires_at=datetime.now(timezone.utc) + timedelta(hours=1),
+        )
+
+        # Act
+        result = connection_repo.upsert(db, connection_data)
+
+        # Assert
+        assert result.id == connection.id
+        assert result.access_token == "new_access"
+        assert result.refresh_token == "original_refresh"  # Unchanged
+        assert result.provider_user_id == "polar_original"  # Not overwritten
+        assert result.scope == "read_all"  # Unchanged
+
     def test_get_active_count(self, db: Session, connection_repo: UserConnectionRepository) -> None:
         """Test counting active connections."""
         # Arrange
@@ -5,6 +5,7 @@ Tests XML file processing from S3 for Apple Health data imports.
 """
 
 import os
+from collections.abc import Generator
 from pathlib import Path
 from unittest.mock import MagicMock, patch
 
@@ -218,18 +219,27 @@ class TestProcessUploadTask:
 class TestImportXmlData:
     """Test suite for _import_xml_data helper function."""
 
-    @patch("app.integrations.celery.tasks.process_aws_upload_task.XMLService")
-    @patch("app.integrations.celery.tasks.process_aws_upload_task.event_record_service")
-    @patch("app.integrations.celery.tasks.process_aws_upload_task.timeseries_service")
-    def test_import_xml_data_creates_records(
-        self,
-        mock_timeseries_service: MagicMock,
-        mock_event_record_service: MagicMock,
-        mock_xml_service_class: MagicMock,
-        db: Session,
-    ) -> None:
+    @pytest.fixture
+    def import_mocks(self) -> Generator[dict[str, MagicMock], None, None]:
+        """Patch the parser and services used by _import_xml_data."""
+        module = "app.integrations.celery.tasks.process_aws_upload_task"
+        with (
+            patch(f"{module}.XMLService") as mock_xml_service_class,
+            patch(f"{module}.event_record_service") as mock_event_record_service,
+            patch(f"{module}.timeseries_service") as mock_timeseries_service,
+        ):
+            yield {
+                "xml_service_class": mock_xml_service_class,
+                "event_record_service": mock_event_record_service,
+                "timeseries_service": mock_timeseries_service,
+            }
+
+    def test_import_xml_data_creates_records(self, db: Session, import_mocks: dict[str, MagicMock]) -> None:
         """Test that XML data is properly imported into database."""
         # Arrange
+        mock_xml_service_class = import_mocks["xml_service_class"]
+        mock_event_record_service = import_mocks["event_record_service"]
+        mock_timeseries_service = import_mocks["timeseries_service"]
         user = UserFactory()
         xml_path = "/tmp/test.xml"
 
@@ -254,18 +264,11 @@ class TestImportXmlData:
         mock_event_record_service.create_detail.assert_called_once()
         mock_timeseries_service.bulk_create_samples.assert_called_once_with(db, mock_time_series_records)
 
-    @patch("app.integrations.celery.tasks.process_aws_upload_task.XMLService")
-    @patch("app.integrations.celery.tasks.process_aws_upload_task.event_record_service")
-    @patch("app.integrations.celery.tasks.process_aws_upload_task.timeseries_service")
-    def test_import_xml_data_handles_multiple_workouts(
-        self,
-        mock_timeseries_service: MagicMock,
-        mock_event_record_service: MagicMock,
-        mock_xml_service_class: MagicMock,
-        db: Session,
-    ) -> None:
+    def test_import_xml_data_handles_multiple_workouts(self, db: Session, import_mocks: dict[str, MagicMock]) -> None:
         """Test importing XML data with multiple workouts."""
         # Arrange
+        mock_xml_service_class = import_mocks["xml_service_class"]
+        mock_event_record_service = import_mocks["event_record_service"]
         user = UserFactory()
         xml_path = "/tmp/test.xml"
 
@@ -286,18 +289,12 @@ class TestImportXmlData:
         assert mock_event_record_service.create.call_count == 2
         assert mock_event_record_service.create_detail.call_count == 2
 
-    @patch("app.integrations.celery.tasks.process_aws_upload_task.XMLService")
-    @patch("app.integrations.celery.tasks.process_aws_upload_task.event_record_service")
-    @patch("app.integrations.celery.tasks.process_aws_upload_task.timeseries_service")
-    def test_import_xml_data_skips_empty_time_series(
-        self,
-        mock_timeseries_service: MagicMock,
-        mock_event_record_service: MagicMock,
-        mock_xml_service_class: MagicMock,
-        db: Session,
-    ) -> None:
+    def test_import_xml_data_skips_empty_time_series(self, db: Session, import_mocks: dict[str, MagicMock]) -> None:
         """Test that empty time series data is not imported."""
         # Arrange
+        mock_xml_service_class = import_mocks["xml_service_class"]
+        mock_event_record_service = import_mocks["event_record_service"]
+        mock_timeseries_service = import_mocks["timeseries_service"]
         user = UserFactory()
         xml_path = "/tmp/test.xml"
 
@@ -315,18 +312,11 @@ class TestImportXmlData:
         mock_timeseries_service.bulk_create_samples.assert_not_called()
         mock_event_record_service.create.assert_not_called()
 
-    @patch("app.integrations.celery.tasks.process_aws_upload_task.XMLService")
-    @patch("app.integrations.celery.tasks.process_aws_upload_task.event_record_service")
-    @patch("app.integrations.celery.tasks.process_aws_upload_task.timeseries_service")
-    def test_import_xml_data_with_time_series_only(
-        self,
-        mock_timeseries_service: MagicMock,
-        mock_event_record_service: MagicMock,
-        mock_xml_service_class: MagicMock,
-        db: Session,
-    ) -> None:
+    def test_import_xml_data_with_time_series_only(self, db: Session, import_mocks: dict[str, MagicMock]) -> None:
         """Test importing only time series data."""
         # Arrange
+        mock_xml_service_class = import_mocks["xml_service_class"]
+        mock_timeseries_service = import_mocks["timeseries_service"]
         user = UserFactory()
         xml_path = "/tmp/test.xml"
 
@@ -344,16 +334,12 @@ class TestImportXmlData:
         # Assert
         mock_timeseries_service.bulk_create_samples.assert_called_once_with(db, mock_time_series_records)
 
-    @patch("app.integrations.celery.tasks.process_aws_upload_task.XMLService")
-    @patch("app.integrations.celery.tasks.process_aws_upload_task.event_record_service")
     def test_import_xml_data_xmlservice_receives_correct_params(
-        self,
-        mock_event_record_service: MagicMock,
-        mock_xml_service_class: MagicMock,
-        db: Session,
+        self, db: Session, import_mocks: dict[str, MagicMock]
     ) -> None:
         """Test that XMLService is initialized with correct parameters."""
         # Arrange
+        mock_xml_service_class = import_mocks["xml_service_class"]
         user = UserFactory()
         xml_path = "/tmp/test.xml"
 
@@ -0,0 +1,40 @@
+"""
+Tests for JSON utility functions.
+
+Tests decoding with orjson and the stdlib fallback.
+"""
+
+import json
+import math
+
+import pytest
+
+from app.utils.json_utils import json_loads
+
+
+class TestJsonLoads:
+    """Test suite for json_loads."""
+
+    @pytest.mark.parametrize("content", ['{"data": [1, 2.5, "x", null]}', b'{"data": [1, 2.5, "x", null]}'])
+    def test_json_loads_str_and_bytes(self, content: str | bytes) -> None:
+        """Should decode both text and raw response bytes."""
+        # Act
+        result = json_loads(content)
+
+        # Assert
+        assert result == {"data": [1, 2.5, "x", None]}
+
+    def test_json_loads_nan_falls_back_to_stdlib(self) -> None:
+        """Should accept NaN/Infinity like json.loads does."""
+        # Act
+        result = json_loads('{"value": NaN, "max": Infinity}')
+
+        # Assert
+        assert math.isnan(result["value"])
+        assert result["max"] == math.inf
+
+    def test_json_loads_invalid_raises_json_decode_error(self) -> None:
+        """Should raise json.JSONDecodeError for invalid input."""
+        # Act & Assert
+        with pytest.raises(json.JSONDecodeError):
+            json_loads("{not json")